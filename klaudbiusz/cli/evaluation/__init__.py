@@ -11,13 +11,33 @@ High-level API for running evaluations:
 """
 
 import asyncio
+import queue
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from cli.evaluation.eval_checks import has_dockerfile
+from cli.evaluation.eval_metrics import eff_units
+from cli.evaluation.evaluate_all import (
+    generate_summary_report,
+    load_prompts_and_metrics_from_bulk_run,
+)
+from cli.utils.apps_discovery import find_latest_apps_dir, list_apps_in_dir
 from cli.utils.shared import is_databricks_environment
 
 
+def _print_mlflow_run(future: Future[str | None]) -> None:
+    """Report the outcome of a background MLflow logging job."""
+    try:
+        run_id = future.result()
+    except Exception as e:
+        print(f"MLflow logging failed: {e}")
+        return
+    if run_id:
+        print(f"MLflow run logged: {run_id}")
+
+
 def run_evaluation_simple(
     apps_dir: str | Path,
     mlflow_experiment: str | None = None,
@@ -30,7 +50,10 @@ def run_evaluation_simple(
     Handles:
     - Environment detection (Databricks auto-enables no_dagger)
     - Apps directory discovery (supports UC Volumes with latest.txt)
-    - MLflow logging (if experiment provided)
+    - Backend selection: Dagger, or with no_dagger parallel Docker containers when
+      the Docker daemon is reachable and sequential host evaluation otherwise
+    - MLflow logging (if experiment provided), done in the background so the
+      report is returned without waiting on the tracking server
 
     Args:
         apps_dir: Path to directory containing apps to evaluate.
@@ -38,8 +61,9 @@ def run_evaluation_simple(
         mlflow_experiment: Optional MLflow experiment name for logging results.
         parallelism: Number of parallel evaluations (default: 4).
         fast_mode: Skip slow LLM/VLM checks for faster evaluation (default: True).
-        no_dagger: Run without any containers (no Dagger, no Docker).
-                   Apps with Dockerfiles will be skipped. Auto-detected if None.
+        no_dagger: Run without Dagger. Apps are evaluated in parallel in plain Docker
+                   containers if a Docker daemon is reachable, otherwise sequentially on
+                   the host. Apps with Dockerfiles will be skipped. Auto-detected if None.
 
     Returns:
         Evaluation report dict with 'summary' and 'apps' keys.
@@ -54,13 +78,6 @@ def run_evaluation_simple(
         print(f"Evaluated {report['summary']['total_apps']} apps")
         print(f"Average score: {report['summary']['metrics_summary']['avg_appeval_100']}")
     """
-    from cli.evaluation.eval_metrics import eff_units
-    from cli.evaluation.evaluate_all import (
-        generate_summary_report,
-        load_prompts_and_metrics_from_bulk_run,
-    )
-    from cli.utils.apps_discovery import find_latest_apps_dir, list_apps_in_dir
-
     # Resolve apps directory
     apps_path = Path(apps_dir)
     resolved_path = find_latest_apps_dir(apps_path)
@@ -76,82 +93,152 @@ def run_evaluation_simple(
         if no_dagger:
             print("Databricks environment detected - using Docker CLI mode")
 
-    # Load prompts and generation metrics
-    prompts, gen_metrics, _ = load_prompts_and_metrics_from_bulk_run()
-
     # Get app directories
     app_dirs = list_apps_in_dir(resolved_path)
     if not app_dirs:
         raise ValueError(f"No apps found in: {resolved_path}")
 
+    # Load prompts and generation metrics (bulk_run results, then per-app generation_metrics.json)
+    prompts, gen_metrics, _ = load_prompts_and_metrics_from_bulk_run(app_dirs)
+
     print(f"Evaluating {len(app_dirs)} apps from {resolved_path}...")
 
     results: list[dict[str, Any]] = []
     eval_start = time.time()
 
     if no_dagger:
-        from dataclasses import asdict
         from cli.evaluation.evaluate_app import evaluate_app
-
-        # Filter out apps with Dockerfiles (they require Docker)
-        docker_apps = [d for d in app_dirs if (d / "Dockerfile").exists()]
-        non_docker_apps = [d for d in app_dirs if not (d / "Dockerfile").exists()]
+        from cli.utils.ts_workspace_docker import docker_daemon_available
+
+        use_docker = docker_daemon_available()
+        if use_docker:
+            print("Docker daemon available - evaluating apps in parallel Docker containers")
+        else:
+            print("Docker daemon not available - evaluating apps on the host")
+
+        # Filter out apps with Dockerfiles (Docker-only apps need Dagger mode). Stat once
+        # per app, in parallel: on UC Volumes each stat is a network round trip
+        with ThreadPoolExecutor(max_workers=min(32, len(app_dirs))) as stat_executor:
+            dockerfile_map = dict(
+                zip(app_dirs, stat_executor.map(has_dockerfile, map(str, app_dirs)))
+            )
+        docker_apps: list[Path] = []
+        non_docker_apps: list[Path] = []
+        for d in app_dirs:
+            if dockerfile_map[d]:
+                docker_apps.append(d)
+            else:
+                non_docker_apps.append(d)
 
         if docker_apps:
-            print(f"Skipping {len(docker_apps)} apps with Dockerfiles (require Docker)")
+            reason = "not supported by the Docker evaluator" if use_docker else "require Docker"
+            print(f"Skipping {len(docker_apps)} apps with Dockerfiles ({reason})")
 
         if not non_docker_apps:
             raise ValueError("No apps without Dockerfiles found. Use Dagger mode for Docker-based apps.")
 
         app_dirs = non_docker_apps
 
-        for i, app_dir in enumerate(app_dirs, 1):
-            port = 8000 + i
-            print(f"[{i}/{len(app_dirs)}] {app_dir.name}")
+        if use_docker:
+            from cli.evaluation.evaluate_app_docker import evaluate_app_docker_with_metadata
+            from cli.utils.ts_workspace_docker import DockerWorkspacePool
+
+            # Containers isolate processes and ports, so apps can be evaluated in parallel
+            # on plain threads (no event loop: notebooks already run one). One warm
+            # container per concurrent evaluation is started up front
+            pool_size = min(parallelism, len(app_dirs))
+
+            # Port/CPU slots are recycled as workers free up (8001..8000+pool_size)
+            slots: queue.Queue[int] = queue.Queue()
+            for slot in range(1, pool_size + 1):
+                slots.put(slot)
+
+            def eval_one(idx: int, app_dir: Path, prompt: str | None) -> dict[str, Any] | None:
+                slot = slots.get()
+                try:
+                    return evaluate_app_docker_with_metadata(
+                        app_dir,
+                        prompt,
+                        gen_metrics,
+                        idx,
+                        len(app_dirs),
+                        port=8000 + slot,
+                        fast_mode=fast_mode,
+                        pool=pool,
+                        has_dockerfile=dockerfile_map[app_dir],
+                        # Concurrent evaluations hold distinct slots, so their CPU sets don't overlap
+                        cpu_slot=slot - 1,
+                        slots=pool_size,
+                    )
+                finally:
+                    slots.put(slot)
+
+            executor: ThreadPoolExecutor | None = None
+            pool: DockerWorkspacePool | None = None
+            interrupted = True
             try:
-                result = evaluate_app(app_dir, prompts.get(app_dir.name), port)
-                result_dict = asdict(result)
-
-                # Add generation metrics if available
-                import json
-                gm = gen_metrics.get(app_dir.name)
-                if not gm:
-                    metrics_file = app_dir / "generation_metrics.json"
-                    if metrics_file.exists():
-                        try:
-                            gm = json.loads(metrics_file.read_text())
-                        except Exception:
-                            pass
-                if gm:
-                    result_dict["generation_metrics"] = gm
-
-                results.append(result_dict)
-            except KeyboardInterrupt:
-                raise
-            except Exception as e:
-                print(f"Error evaluating {app_dir.name}: {e}")
+                executor = ThreadPoolExecutor(max_workers=pool_size)
+                pool = DockerWorkspacePool(size=pool_size)
+                futures = [executor.submit(eval_one, i, d, prompts.get(d.name)) for i, d in enumerate(app_dirs, 1)]
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is not None:
+                        results.append(result)
+                        print(f"[done {len(results)}/{len(app_dirs)}] {result['app_name']}")
+                interrupted = False
+            finally:
+                # Queued evaluations are cancelled. In-flight ones can't be stopped and
+                # their threads are still joined at interpreter exit, so on Ctrl-C (or any
+                # error) their containers are removed too: the running steps then fail fast
+                if executor is not None:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                if pool is not None:
+                    pool.close(remove_in_use=interrupted)
+        else:
+            # No Docker: evaluate on the host, sequentially (template stop
+            # scripts kill app processes machine-wide, so this can't run in parallel)
+            for i, app_dir in enumerate(app_dirs, 1):
+                name = app_dir.name
+                port = 8000 + i
+                print(f"[{i}/{len(app_dirs)}] {name}")
+                try:
+                    result = evaluate_app(app_dir, prompts.get(name), port)
+                    result_dict = result.to_dict()
+
+                    # Add generation metrics if available
+                    gm = gen_metrics.get(name)
+                    if gm:
+                        result_dict["generation_metrics"] = gm
+
+                    results.append(result_dict)
+                except KeyboardInterrupt:
+                    raise
+                except Exception as e:
+                    print(f"Error evaluating {name}: {e}")
     else:
-        from dataclasses import asdict as asdict_fn
         import dagger
         from cli.evaluation.evaluate_app_dagger import evaluate_app_async
 
         async def run_dagger_evaluations() -> list[dict[str, Any]]:
             async with dagger.Connection() as client:
+                # Eager tasks run synchronously until their first await, so apps that
+                # fail fast complete without a round trip through the event loop
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
                 semaphore = asyncio.Semaphore(parallelism)
-                dagger_results: list[dict[str, Any]] = []
 
-                async def eval_one(idx: int, app_dir: Path) -> dict[str, Any] | None:
+                async def eval_one(
+                    idx: int, app_dir: Path, name: str, prompt: str | None, gm: dict | None
+                ) -> dict[str, Any] | None:
                     async with semaphore:
                         port = 8000 + idx
                         try:
                             result = await evaluate_app_async(
-                                client, app_dir, prompts.get(app_dir.name), port, fast_mode=fast_mode
+                                client, app_dir, prompt, port, fast_mode=fast_mode
                             )
-                            result_dict = asdict_fn(result)
-                            if app_dir.name in gen_metrics:
-                                result_dict["generation_metrics"] = gen_metrics[app_dir.name]
+                            result_dict = result.to_dict()
+                            if gm is not None:
+                                result_dict["generation_metrics"] = gm
                                 if result_dict["metrics"].get("eff_units") is None:
-                                    gm = gen_metrics[app_dir.name]
                                     tokens = gm.get("input_tokens", 0) + gm.get("output_tokens", 0)
                                     result_dict["metrics"]["eff_units"] = eff_units(
                                         tokens_used=tokens if tokens > 0 else None,
@@ -160,13 +247,21 @@ def run_evaluation_simple(
                                     )
                             return result_dict
                         except Exception as e:
-                            print(f"Error evaluating {app_dir.name}: {e}")
+                            print(f"Error evaluating {name}: {e}")
                             return None
 
-                tasks = [eval_one(i, d) for i, d in enumerate(app_dirs, 1)]
-                for result in await asyncio.gather(*tasks):
-                    if result is not None:
-                        dagger_results.append(result)
+                # Report results as apps finish rather than after the slowest one
+                dagger_results: list[dict[str, Any]] = []
+                async with asyncio.TaskGroup() as tg:
+                    tasks = []
+                    for i, d in enumerate(app_dirs, 1):
+                        name = d.name
+                        tasks.append(tg.create_task(eval_one(i, d, name, prompts.get(name), gen_metrics.get(name))))
+                    for next_done in asyncio.as_completed(tasks):
+                        result = await next_done
+                        if result is not None:
+                            dagger_results.append(result)
+                            print(f"[done {len(dagger_results)}/{len(app_dirs)}] {result['app_name']}")
                 return dagger_results
 
         results = asyncio.run(run_dagger_evaluations())
@@ -182,14 +277,13 @@ def run_evaluation_simple(
         "apps": results,
     }
 
-    # Log to MLflow if experiment provided
+    # Log to MLflow if experiment provided (in the background, flushed at exit)
     if mlflow_experiment:
-        from cli.evaluation.tracking import log_evaluation_to_mlflow, setup_mlflow
+        from cli.evaluation.tracking import log_evaluation_to_mlflow_async, setup_mlflow
 
         if setup_mlflow(mlflow_experiment):
-            run_id = log_evaluation_to_mlflow(report)
-            if run_id:
-                print(f"MLflow run logged: {run_id}")
+            future = log_evaluation_to_mlflow_async(report)
+            future.add_done_callback(_print_mlflow_run)
 
     return report
 
@@ -1,9 +1,58 @@
 """Shared evaluation check functions for Klaudbiusz evaluation framework."""
 
 import json
+import os
 from pathlib import Path
 from typing import Callable
 
+from cli.utils.coverage import COVERAGE_ROW_RE
+
+_TEST_FILE_SUFFIXES = (".test.ts", ".spec.ts", ".test.tsx", ".spec.tsx")
+_SKIP_DIRS = {"node_modules", ".git"}
+
+
+def has_dockerfile(app_dir: Path | str) -> bool:
+    """Check whether an app directory has a Dockerfile (a plain stat, no Path objects)."""
+    return os.path.exists(os.path.join(app_dir, "Dockerfile"))
+
+
+def has_test_files(app_dir: Path) -> bool:
+    """Check whether an app contains any TypeScript test files.
+
+    Walks the tree without descending into node_modules (often 100k+ files
+    once dependencies are installed) and stops at the first match.
+    """
+    for _root, dirs, files in os.walk(app_dir):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        if any(name.endswith(_TEST_FILE_SUFFIXES) for name in files):
+            return True
+    return False
+
+
+def parse_coverage_pct(*outputs: str) -> float:
+    """Parse line coverage percentage from test runner output.
+
+    Scans each output for the "All files" summary row in a single regex pass
+    instead of splitting and lowercasing every line. Outputs are searched
+    separately (no concatenation); the last matching row wins.
+
+    Args:
+        *outputs: Test output streams, e.g. stdout and stderr
+
+    Returns:
+        Coverage percentage, or 0.0 if no summary row was found
+    """
+    coverage_pct = 0.0
+    for output in outputs:
+        for match in COVERAGE_ROW_RE.finditer(output):
+            parts = match.group(0).split("|")
+            if len(parts) >= 2:
+                try:
+                    coverage_pct = float(parts[1].strip().replace("%", ""))
+                except ValueError:
+                    pass
+    return coverage_pct
+
 
 def check_databricks_connectivity(
     app_dir: Path,
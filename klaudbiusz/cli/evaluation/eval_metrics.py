@@ -1,5 +1,6 @@
 """Shared evaluation metric calculations for Klaudbiusz evaluation framework."""
 
+from functools import lru_cache
 from math import prod
 from typing import Protocol
 
@@ -36,6 +37,9 @@ def _to01_5(x):
     return max(0.0, min(1.0, (x or 0) / 5.0))
 
 
+# Inputs are a handful of small-domain scalars and identical failure modes recur
+# across a bulk run, so the score is memoized.
+@lru_cache(maxsize=4096)
 def calculate_appeval_100(
     build_success: bool,
     runtime_success: bool,
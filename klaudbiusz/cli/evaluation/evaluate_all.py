@@ -22,11 +22,13 @@ import json
 import sys
 import time
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+from cli.evaluation.eval_checks import has_dockerfile
 from cli.evaluation.eval_metrics import eff_units
 from cli.utils.shared import is_databricks_environment
 
@@ -59,13 +61,41 @@ def get_git_commit_hash() -> str | None:
     return None
 
 
-def load_prompts_and_metrics_from_bulk_run() -> tuple[dict[str, str], dict[str, dict], dict[str, str]]:
+def _read_generation_metrics(app_dir: Path) -> dict | None:
+    """Read generation_metrics.json from an app directory, if present and valid."""
+    try:
+        return json.loads((app_dir / "generation_metrics.json").read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def load_prompts_and_metrics_from_bulk_run(
+    app_dirs: list[Path] | None = None,
+) -> tuple[dict[str, str], dict[str, dict], dict[str, str]]:
     """Load prompts and generation metrics using PROMPTS dict from bulk_run.
 
+    Apps in app_dirs without metrics in the bulk_run results fall back to their
+    generation_metrics.json, read up front in parallel so evaluation loops only
+    need a dict lookup.
+
     Returns:
         (prompts_dict, metrics_dict, run_config_dict) where metrics_dict contains cost_usd, input_tokens, output_tokens, turns
         and run_config_dict contains mcp_binary, backend, model
     """
+    prompts, gen_metrics, run_config = _load_bulk_run_results()
+
+    missing = [d for d in app_dirs or [] if not gen_metrics.get(d.name)]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(32, len(missing))) as executor:
+            for app_dir, gm in zip(missing, executor.map(_read_generation_metrics, missing)):
+                if gm:
+                    gen_metrics[app_dir.name] = gm
+
+    return prompts, gen_metrics, run_config
+
+
+def _load_bulk_run_results() -> tuple[dict[str, str], dict[str, dict], dict[str, str]]:
+    """Load prompts, per-app metrics and run config from the latest bulk_run results file."""
     try:
         # Import PROMPTS from prompts module
         from cli.prompts import DATABRICKS_PROMPTS as PROMPTS
@@ -964,17 +994,6 @@ async def main_async():
     # Note: Base image is built from Dockerfile by Dagger (with BuildKit caching)
     # No need to pre-build - Dagger handles it efficiently
 
-    # Load prompts and generation metrics from bulk_run.py and bulk_run_results
-    prompts, gen_metrics, run_config = load_prompts_and_metrics_from_bulk_run()
-
-    # Override run config with CLI args if provided
-    if args.mcp_binary:
-        run_config["mcp_binary"] = args.mcp_binary
-    if args.backend:
-        run_config["backend"] = args.backend
-    if args.model:
-        run_config["model"] = args.model
-
     # Get all app directories (exclude hidden dirs and special dirs like 'logs')
     excluded_dirs = {"logs", "node_modules", "__pycache__", ".git"}
     all_app_dirs = [
@@ -985,6 +1004,17 @@ async def main_async():
     # Filter based on command-line arguments
     app_dirs = filter_app_dirs(all_app_dirs, args)
 
+    # Load prompts and generation metrics from bulk_run.py and bulk_run_results
+    prompts, gen_metrics, run_config = load_prompts_and_metrics_from_bulk_run(app_dirs)
+
+    # Override run config with CLI args if provided
+    if args.mcp_binary:
+        run_config["mcp_binary"] = args.mcp_binary
+    if args.backend:
+        run_config["backend"] = args.backend
+    if args.model:
+        run_config["model"] = args.model
+
     # Auto-detect CPU count if --parallel 0
     import os as os_module
     cpu_count = os_module.cpu_count() or 1
@@ -1029,12 +1059,16 @@ async def main_async():
 
     if args.no_dagger:
         # Local evaluation (no Docker, no Dagger)
-        from dataclasses import asdict
         from cli.evaluation.evaluate_app import evaluate_app
 
         # Filter out apps with Dockerfiles (they require Docker)
-        docker_apps = [d for d in app_dirs if (d / "Dockerfile").exists()]
-        non_docker_apps = [d for d in app_dirs if not (d / "Dockerfile").exists()]
+        docker_apps = []
+        non_docker_apps = []
+        for d in app_dirs:
+            if has_dockerfile(str(d)):
+                docker_apps.append(d)
+            else:
+                non_docker_apps.append(d)
 
         if docker_apps:
             print(f"⚠️  Skipping {len(docker_apps)} apps with Dockerfiles (require Docker):")
@@ -1055,17 +1089,10 @@ async def main_async():
             port = 8000 + i
             try:
                 result = evaluate_app(app_dir, prompts.get(app_dir.name), port)
-                result_dict = asdict(result)
+                result_dict = result.to_dict()
 
                 # Add generation metrics from bulk_run results or generation_metrics.json
                 gm = gen_metrics.get(app_dir.name)
-                if not gm:
-                    metrics_file = app_dir / "generation_metrics.json"
-                    if metrics_file.exists():
-                        try:
-                            gm = json.loads(metrics_file.read_text())
-                        except Exception:
-                            pass
                 if gm:
                     result_dict["generation_metrics"] = gm
 
@@ -1076,7 +1103,6 @@ async def main_async():
                 print(f"❌ Error evaluating {app_dir.name}: {e}")
     else:
         # Dagger-based evaluation (import here to make dagger optional)
-        from dataclasses import asdict
         import dagger
         from cli.evaluation.evaluate_app_dagger import evaluate_app_async
 
@@ -1095,18 +1121,10 @@ async def main_async():
 
             try:
                 result = await evaluate_app_async(client, app_dir, prompt, port, fast_mode=fast_mode)
-                result_dict = asdict(result)
+                result_dict = result.to_dict()
 
-                # Try to get generation metrics from bulk_run results or generation_metrics.json
+                # Generation metrics from bulk_run results or generation_metrics.json
                 gm = gen_metrics.get(app_dir.name)
-                if not gm:
-                    # Fallback: read from generation_metrics.json in app directory
-                    metrics_file = app_dir / "generation_metrics.json"
-                    if metrics_file.exists():
-                        try:
-                            gm = json.loads(metrics_file.read_text())
-                        except Exception:
-                            pass
                 if gm:
                     result_dict["generation_metrics"] = gm
                     if result_dict["metrics"].get("eff_units") is None:
@@ -20,13 +20,18 @@ import os
 import subprocess
 import sys
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
 
-from cli.evaluation.eval_checks import check_databricks_connectivity as _check_db_connectivity, extract_sql_queries
+from cli.evaluation.eval_checks import (
+    check_databricks_connectivity as _check_db_connectivity,
+    extract_sql_queries,
+    has_dockerfile,
+    parse_coverage_pct,
+)
 from cli.evaluation.eval_metrics import calculate_appeval_100, eff_units
 from cli.utils.template_detection import detect_template
 
@@ -129,6 +134,10 @@ class FullMetrics:
     # Template information
     template_type: str = "unknown"
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return all fields as a plain dict (every field is a scalar)."""
+        return dict(self.__dict__)
+
 
 @dataclass
 class EvalResult:
@@ -141,6 +150,10 @@ class EvalResult:
     issues: list[str]
     details: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict, without the deep copy done by dataclasses.asdict."""
+        return {**self.__dict__, "metrics": self.metrics.to_dict()}
+
 
 def run_command(cmd: list[str], cwd: str | None = None, timeout: int = 300, env: dict[str, str] | None = None) -> tuple[bool, str, str]:
     """Run a shell command and return (success, stdout, stderr)."""
@@ -434,7 +447,7 @@ def check_type_safety(app_dir: Path, template: str = "unknown") -> bool:
         script_dir = "dbx-sdk"
     elif template == "trpc":
         script_dir = "trpc"
-    elif (app_dir / "Dockerfile").exists():
+    elif has_dockerfile(app_dir):
         script_dir = "docker"
     else:
         # Unknown template - fail
@@ -469,7 +482,7 @@ def check_tests_pass(app_dir: Path, template: str = "unknown") -> tuple[bool, fl
         script_dir = "dbx-sdk"
     elif template == "trpc":
         script_dir = "trpc"
-    elif (app_dir / "Dockerfile").exists():
+    elif has_dockerfile(app_dir):
         script_dir = "docker"
     else:
         # Unknown template - fail
@@ -501,16 +514,7 @@ def check_tests_pass(app_dir: Path, template: str = "unknown") -> tuple[bool, fl
     )
 
     # Parse coverage from Node.js test runner output
-    coverage_pct = 0.0
-    output = stdout + stderr
-    for line in output.split("\n"):
-        if "all files" in line.lower() and "%" in line:
-            parts = line.split("|")
-            if len(parts) >= 2:
-                try:
-                    coverage_pct = float(parts[1].strip().replace("%", ""))
-                except (ValueError, IndexError):
-                    pass
+    coverage_pct = parse_coverage_pct(stdout, stderr)
 
     return success, coverage_pct, has_tests
 
@@ -1019,7 +1023,7 @@ def main():
             if app_dir.is_dir() and not app_dir.name.startswith("."):
                 prompt = prompts.get(app_dir.name)
                 result = evaluate_app(app_dir, prompt)
-                results.append(asdict(result))
+                results.append(result.to_dict())
 
         # Save combined results with bulk run metadata
         output_data = {
@@ -1049,10 +1053,10 @@ def main():
         print("\n" + "=" * 60)
         print("EVALUATION RESULT")
         print("=" * 60)
-        print(json.dumps(asdict(result), indent=2))
+        print(json.dumps(result.to_dict(), indent=2))
 
         output_file = app_dir / "eval_result.json"
-        output_file.write_text(json.dumps(asdict(result), indent=2))
+        output_file.write_text(json.dumps(result.to_dict(), indent=2))
         print(f"\nResult saved to: {output_file}")
 
 
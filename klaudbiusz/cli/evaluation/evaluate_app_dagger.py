@@ -7,15 +7,14 @@ conflicts and machine environment pollution.
 
 import asyncio
 import json
-import os
 import sys
 import time
-from dataclasses import asdict
 from pathlib import Path
 
 import dagger
 from dotenv import load_dotenv
 
+from cli.evaluation.eval_checks import has_dockerfile, parse_coverage_pct
 from cli.evaluation.evaluate_app import (
     EvalResult,
     FullMetrics,
@@ -26,6 +25,7 @@ from cli.evaluation.evaluate_app import (
     check_ui_functional_vlm,
     load_prompts_from_bulk_results,
 )
+from cli.utils.shared import restore_terminal_cursor
 from cli.utils.template_detection import detect_template, get_actual_app_dir
 from cli.utils.ts_workspace import (
     build_app,
@@ -56,11 +56,6 @@ for env_path in env_paths:
         break
 
 
-def _restore_terminal_cursor() -> None:
-    """Restore terminal cursor after Dagger run (workaround for dagger/dagger#7160)."""
-    os.system("tput cnorm 2>/dev/null || true")
-
-
 async def evaluate_app_async(
     client: dagger.Client,
     app_dir: Path,
@@ -147,7 +142,7 @@ async def evaluate_app_async(
         build_success = build_result.exit_code == 0
         metrics.build_success = build_success
         metrics.build_time_sec = round(build_time, 1)
-        metrics.has_dockerfile = (app_dir / "Dockerfile").exists()
+        metrics.has_dockerfile = has_dockerfile(app_dir)
 
         if not build_success:
             issues.append("Build failed")
@@ -207,16 +202,7 @@ async def evaluate_app_async(
                 metrics.tests_pass = tests_pass
 
                 # Parse coverage from output
-                coverage_pct = 0.0
-                output = test_result.stdout + test_result.stderr
-                for line in output.split("\n"):
-                    if "all files" in line.lower() and "%" in line:
-                        parts = line.split("|")
-                        if len(parts) >= 2:
-                            try:
-                                coverage_pct = float(parts[1].strip().replace("%", ""))
-                            except (ValueError, IndexError):
-                                pass
+                coverage_pct = parse_coverage_pct(test_result.stdout, test_result.stderr)
 
                 metrics.test_coverage_pct = coverage_pct
 
@@ -380,7 +366,7 @@ async def main_async():
                 if app_dir.is_dir() and not app_dir.name.startswith("."):
                     prompt = prompts.get(app_dir.name)
                     result = await evaluate_app_async(client, app_dir, prompt, port)
-                    results.append(asdict(result))
+                    results.append(result.to_dict())
                     port += 1  # Increment port for next app
 
             # Save results
@@ -407,10 +393,10 @@ async def main_async():
             print("\n" + "=" * 60)
             print("EVALUATION RESULT")
             print("=" * 60)
-            print(json.dumps(asdict(result), indent=2))
+            print(json.dumps(result.to_dict(), indent=2))
 
             output_file = app_dir / "eval_result.json"
-            output_file.write_text(json.dumps(asdict(result), indent=2))
+            output_file.write_text(json.dumps(result.to_dict(), indent=2))
             print(f"\nResult saved to: {output_file}")
 
 
@@ -419,7 +405,7 @@ def main():
     try:
         asyncio.run(main_async())
     finally:
-        _restore_terminal_cursor()
+        restore_terminal_cursor()
 
 
 if __name__ == "__main__":
@@ -5,11 +5,14 @@ Uses plain Docker CLI to run evaluations in isolated containers.
 Useful for environments that have Docker but not Dagger (e.g., Databricks Jobs).
 """
 
+import json
 import time
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from cli.evaluation.eval_metrics import calculate_appeval_100
+from cli.evaluation.eval_checks import has_dockerfile as _has_dockerfile
+from cli.evaluation.eval_checks import has_test_files, parse_coverage_pct
+from cli.evaluation.eval_metrics import calculate_appeval_100, eff_units
 from cli.evaluation.evaluate_app import (
     EvalResult,
     FullMetrics,
@@ -21,11 +24,13 @@ from cli.evaluation.evaluate_app import (
 )
 from cli.utils.template_detection import detect_template
 from cli.utils.ts_workspace_docker import (
+    DockerWorkspacePool,
     build_app,
     check_runtime,
     check_types,
     create_ts_workspace_docker,
     install_dependencies,
+    run_ci_pipeline,
     run_tests,
 )
 
@@ -35,6 +40,10 @@ def evaluate_app_docker(
     prompt: str | None = None,
     port: int = 8000,
     fast_mode: bool = False,
+    pool: DockerWorkspacePool | None = None,
+    has_dockerfile: bool | None = None,
+    cpu_slot: int | None = None,
+    slots: int = 1,
 ) -> EvalResult:
     """Run full evaluation on an app using Docker CLI.
 
@@ -42,7 +51,13 @@ def evaluate_app_docker(
         app_dir: Path to the app directory
         prompt: Optional prompt used to generate the app
         port: Port to use for the app (unique per parallel execution)
-        fast_mode: Skip slow LLM/VLM checks (DB connectivity, data validity, UI renders)
+        fast_mode: Skip slow LLM/VLM checks (DB connectivity, data validity, UI renders) and
+            run install/build/typecheck/test as a single container exec
+        pool: Optional warm container pool; a fresh container is created per app if None
+        has_dockerfile: Whether the app has a Dockerfile, if the caller already checked
+        cpu_slot: Optional 0-based slot (out of `slots` concurrent evaluations) to pin
+            the container's CPUs to
+        slots: Number of concurrent evaluations
 
     Returns:
         EvalResult with metrics
@@ -50,12 +65,15 @@ def evaluate_app_docker(
     print(f"\nEvaluating: {app_dir.name}")
     print("=" * 60)
 
+    if has_dockerfile is None:
+        has_dockerfile = _has_dockerfile(app_dir)
+
     # Detect template type
     template = detect_template(app_dir)
     print(f"  Template: {template}")
 
     # Skip only if template is unknown and has Dockerfile
-    if template == "unknown" and (app_dir / "Dockerfile").exists():
+    if template == "unknown" and has_dockerfile:
         print("  ⚠️  Docker-only apps not yet supported with Docker wrapper")
         metrics = FullMetrics()
         metrics.template_type = "docker"
@@ -76,16 +94,28 @@ def evaluate_app_docker(
     workspace = None
     try:
         # Create Docker workspace for this app
-        print("  [0/7] Creating Docker workspace...")
-        workspace = create_ts_workspace_docker(
-            app_dir=app_dir,
-            template=template,
-            port=port,
-        )
+        if pool:
+            print("  [0/7] Acquiring Docker workspace from pool...")
+            workspace = pool.acquire(app_dir, template, port, cpu_slot=cpu_slot, slots=slots)
+        else:
+            print("  [0/7] Creating Docker workspace...")
+            workspace = create_ts_workspace_docker(
+                app_dir=app_dir,
+                template=template,
+                port=port,
+                cpu_slot=cpu_slot,
+                slots=slots,
+            )
 
         # Metric 0: Install dependencies
         print("  [0/7] Installing dependencies...")
-        install_result = install_dependencies(workspace)
+        test_port = port + 1000
+        if fast_mode:
+            # Run install/build/typecheck/test as one exec; results are reported per metric below
+            ci_steps = run_ci_pipeline(workspace, test_port)
+            install_result, _ = ci_steps["install"]
+        else:
+            install_result = install_dependencies(workspace)
         deps_installed = install_result.exit_code == 0
 
         if not deps_installed:
@@ -96,14 +126,17 @@ def evaluate_app_docker(
 
         # Metric 1: Build
         print("  [1/7] Checking build success...")
-        build_start = time.time()
-        build_result = build_app(workspace)
-        build_time = time.time() - build_start
+        if fast_mode:
+            build_result, build_time = ci_steps["build"]
+        else:
+            build_start = time.time()
+            build_result = build_app(workspace)
+            build_time = time.time() - build_start
 
         build_success = build_result.exit_code == 0
         metrics.build_success = build_success
         metrics.build_time_sec = round(build_time, 1)
-        metrics.has_dockerfile = (app_dir / "Dockerfile").exists()
+        metrics.has_dockerfile = has_dockerfile
 
         if not build_success:
             issues.append("Build failed")
@@ -139,7 +172,7 @@ def evaluate_app_docker(
         # Metric 3: Type safety (requires dependencies)
         if deps_installed:
             print("  [3/7] Checking type safety...")
-            typecheck_result = check_types(workspace)
+            typecheck_result = ci_steps["typecheck"][0] if fast_mode else check_types(workspace)
             type_safety = typecheck_result.exit_code == 0
             metrics.type_safety = type_safety
 
@@ -153,30 +186,18 @@ def evaluate_app_docker(
         # Metric 4: Tests (requires dependencies)
         if deps_installed:
             print("  [4/7] Checking tests pass...")
-            test_port = port + 1000
             try:
-                test_result = run_tests(workspace, test_port)
+                test_result = ci_steps["test"][0] if fast_mode else run_tests(workspace, test_port)
                 tests_pass = test_result.exit_code == 0
                 metrics.tests_pass = tests_pass
 
                 # Parse coverage from output
-                coverage_pct = 0.0
-                output = test_result.stdout + test_result.stderr
-                for line in output.split("\n"):
-                    if "all files" in line.lower() and "%" in line:
-                        parts = line.split("|")
-                        if len(parts) >= 2:
-                            try:
-                                coverage_pct = float(parts[1].strip().replace("%", ""))
-                            except (ValueError, IndexError):
-                                pass
+                coverage_pct = parse_coverage_pct(test_result.stdout, test_result.stderr)
 
                 metrics.test_coverage_pct = coverage_pct
 
                 # Check if test files exist
-                test_files = list(app_dir.glob("**/*.test.ts")) + list(app_dir.glob("**/*.spec.ts"))
-                test_files = [f for f in test_files if "node_modules" not in str(f)]
-                metrics.has_tests = len(test_files) > 0
+                metrics.has_tests = has_test_files(app_dir)
 
                 if not tests_pass:
                     issues.append("Tests failed")
@@ -219,29 +240,36 @@ def evaluate_app_docker(
         issues.append(f"Evaluation error: {str(e)}")
         print(f"  ⚠️  Exception during evaluation: {e}")
     finally:
-        # Always cleanup container
-        if workspace:
+        # Always cleanup container (or hand it back to the pool)
+        if workspace and pool:
+            pool.release(workspace)
+        elif workspace:
             workspace.cleanup()
 
-    # Calculate DevX metrics (run even if evaluation failed)
+    # Calculate DevX metrics (run even if evaluation failed). Both only read
+    # files from the app directory, so run them concurrently
     try:
         print("  [8/9] Checking local runability...")
-        local_score, local_details = check_local_runability(app_dir, template)
-        metrics.local_runability_score = local_score
-        details["local_runability"] = local_details
-        if local_score < 3:
-            issues.append(
-                f"Local runability concerns ({local_score}/5)"
-            )
-
         print("  [9/9] Checking deployability...")
-        deploy_score, deploy_details = check_deployability(app_dir)
-        metrics.deployability_score = deploy_score
-        details["deployability"] = deploy_details
-        if deploy_score < 3:
-            issues.append(
-                f"Deployability concerns ({deploy_score}/5)"
-            )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            local_future = executor.submit(check_local_runability, app_dir, template)
+            deploy_future = executor.submit(check_deployability, app_dir)
+
+            local_score, local_details = local_future.result()
+            metrics.local_runability_score = local_score
+            details["local_runability"] = local_details
+            if local_score < 3:
+                issues.append(
+                    f"Local runability concerns ({local_score}/5)"
+                )
+
+            deploy_score, deploy_details = deploy_future.result()
+            metrics.deployability_score = deploy_score
+            details["deployability"] = deploy_details
+            if deploy_score < 3:
+                issues.append(
+                    f"Deployability concerns ({deploy_score}/5)"
+                )
     except Exception as e:
         print(f"  ⚠️  Could not calculate DevX metrics: {e}")
 
@@ -261,6 +289,26 @@ def evaluate_app_docker(
     except Exception as e:
         print(f"  ⚠️  Could not calculate appeval_100: {e}")
 
+    # Calculate efficiency metric from generation data if available (run even if evaluation failed)
+    try:
+        generation_metrics_file = app_dir / "generation_metrics.json"
+        if generation_metrics_file.exists():
+            generation_metrics = json.loads(generation_metrics_file.read_text())
+            tokens = generation_metrics.get("input_tokens", 0) + generation_metrics.get("output_tokens", 0)
+            metrics.eff_units = eff_units(
+                tokens_used=tokens if tokens > 0 else None,
+                agent_turns=generation_metrics.get("turns"),
+                validation_runs=generation_metrics.get("validation_runs"),
+            )
+    except Exception as e:
+        print(f"  ⚠️  Could not calculate efficiency: {e}")
+
+    # Calculate LOC count (run even if evaluation failed)
+    try:
+        metrics.total_loc = sum(1 for f in app_dir.rglob("*.ts") if f.is_file() and "node_modules" not in str(f))
+    except Exception as e:
+        print(f"  ⚠️  Could not calculate LOC: {e}")
+
     print(f"\nIssues: {len(issues)}")
 
     return EvalResult(
@@ -281,6 +329,10 @@ def evaluate_app_docker_with_metadata(
     total: int,
     port: int = 8000,
     fast_mode: bool = False,
+    pool: DockerWorkspacePool | None = None,
+    has_dockerfile: bool | None = None,
+    cpu_slot: int | None = None,
+    slots: int = 1,
 ) -> dict | None:
     """Wrapper for evaluate_app_docker that adds generation metrics.
 
@@ -292,6 +344,10 @@ def evaluate_app_docker_with_metadata(
         total: Total number of apps
         port: Port to use for the app
         fast_mode: Skip slow LLM/VLM checks
+        pool: Optional warm container pool
+        has_dockerfile: Whether the app has a Dockerfile, if the caller already checked
+        cpu_slot: Optional 0-based CPU pinning slot
+        slots: Number of concurrent evaluations
 
     Returns:
         Dict with evaluation result and generation metrics, or None on error
@@ -299,20 +355,20 @@ def evaluate_app_docker_with_metadata(
     print(f"\n[{index}/{total}] {app_dir.name}")
 
     try:
-        result = evaluate_app_docker(app_dir, prompt, port, fast_mode=fast_mode)
-        result_dict = asdict(result)
+        result = evaluate_app_docker(
+            app_dir,
+            prompt,
+            port,
+            fast_mode=fast_mode,
+            pool=pool,
+            has_dockerfile=has_dockerfile,
+            cpu_slot=cpu_slot,
+            slots=slots,
+        )
+        result_dict = result.to_dict()
 
         # Add generation metrics if available (from bulk_run results or generation_metrics.json)
-        import json
         gm = gen_metrics.get(app_dir.name)
-        if not gm:
-            # Fallback: read from generation_metrics.json in app directory
-            metrics_file = app_dir / "generation_metrics.json"
-            if metrics_file.exists():
-                try:
-                    gm = json.loads(metrics_file.read_text())
-                except Exception:
-                    pass
         if gm:
             result_dict["generation_metrics"] = gm
 
@@ -12,9 +12,14 @@ Usage:
 
     # Log evaluation results
     run_id = log_evaluation_to_mlflow(evaluation_report, run_name="eval-run-1")
+
+    # Or log in the background without blocking the caller
+    future = log_evaluation_to_mlflow_async(evaluation_report)
 """
 
+import atexit
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -26,6 +31,16 @@ load_dotenv()
 
 _mlflow_configured = False
 _experiment_name: str | None = None
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Single background worker for MLflow I/O, drained at interpreter exit."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mlflow-log")
+        atexit.register(_executor.shutdown, wait=True)
+    return _executor
 
 
 def setup_mlflow(
@@ -137,6 +152,28 @@ def log_evaluation_to_mlflow(
     return run_id
 
 
+def log_evaluation_to_mlflow_async(
+    evaluation_report: dict[str, Any],
+    run_name: str | None = None,
+    tags: dict[str, str] | None = None,
+    artifact_paths: list[str] | None = None,
+) -> Future[str | None]:
+    """Log evaluation results to MLflow on a background thread.
+
+    Same arguments as log_evaluation_to_mlflow. Logging runs serially on a
+    single worker thread and pending runs are flushed before the interpreter
+    exits. The report must not be mutated until the future completes.
+
+    Returns:
+        Future resolving to the run ID, or None if logging was skipped.
+
+    Example:
+        future = log_evaluation_to_mlflow_async(report)
+        future.add_done_callback(lambda f: print(f"Logged: {f.result()}"))
+    """
+    return _get_executor().submit(log_evaluation_to_mlflow, evaluation_report, run_name, tags, artifact_paths)
+
+
 def log_generation_to_mlflow(
     generation_results: list[dict[str, Any]],
     run_name: str | None = None,
@@ -186,17 +223,20 @@ def log_generation_to_mlflow(
     total_tokens = sum(r.get("tokens", 0) or 0 for r in generation_results)
     total_turns = sum(r.get("turns", 0) or 0 for r in generation_results)
 
-    mlflow.log_param("total_apps", total_apps)
-    mlflow.log_param("timestamp", timestamp)
-
-    mlflow.log_metric("successful_apps", successful)
-    mlflow.log_metric("failed_apps", total_apps - successful)
-    mlflow.log_metric("success_rate", successful / total_apps if total_apps > 0 else 0)
-    mlflow.log_metric("total_cost_usd", total_cost)
-    mlflow.log_metric("avg_cost_usd", total_cost / total_apps if total_apps > 0 else 0)
-    mlflow.log_metric("total_tokens", total_tokens)
-    mlflow.log_metric("avg_tokens", total_tokens / total_apps if total_apps > 0 else 0)
-    mlflow.log_metric("avg_turns", total_turns / total_apps if total_apps > 0 else 0)
+    # One log_batch request each for params and metrics
+    mlflow.log_params({"total_apps": total_apps, "timestamp": timestamp})
+    mlflow.log_metrics(
+        {
+            "successful_apps": successful,
+            "failed_apps": total_apps - successful,
+            "success_rate": successful / total_apps if total_apps > 0 else 0,
+            "total_cost_usd": total_cost,
+            "avg_cost_usd": total_cost / total_apps if total_apps > 0 else 0,
+            "total_tokens": total_tokens,
+            "avg_tokens": total_tokens / total_apps if total_apps > 0 else 0,
+            "avg_turns": total_turns / total_apps if total_apps > 0 else 0,
+        }
+    )
 
     tracker.end_run()
     return run_id
@@ -206,5 +246,6 @@ __all__ = [
     "setup_mlflow",
     "is_mlflow_enabled",
     "log_evaluation_to_mlflow",
+    "log_evaluation_to_mlflow_async",
     "log_generation_to_mlflow",
 ]
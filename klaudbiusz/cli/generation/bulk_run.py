@@ -11,15 +11,11 @@ from dotenv import load_dotenv
 from tqdm import tqdm
 
 from cli.generation.dagger_run import DaggerAppGenerator
+from cli.utils.shared import restore_terminal_cursor
 
 load_dotenv()
 
 
-def _restore_terminal_cursor() -> None:
-    """Restore terminal cursor after Dagger run (workaround for dagger/dagger#7160)."""
-    os.system("tput cnorm 2>/dev/null || true")
-
-
 def main(
     prompts: str = "databricks",
     backend: str = "claude",
@@ -27,7 +23,7 @@ def main(
     mcp_binary: str | None = None,
     mcp_args: list[str] | None = None,
     output_dir: str | None = None,
-    max_concurrency: int = 6,
+    max_concurrency: int | None = None,
 ) -> None:
     """Bulk app generation via Dagger with parallelism.
 
@@ -38,7 +34,7 @@ def main(
         mcp_binary: Path to edda_mcp binary (required)
         mcp_args: Optional list of args passed to the MCP server
         output_dir: Custom output directory for generated apps
-        max_concurrency: Maximum parallel generations (default: 4)
+        max_concurrency: Maximum parallel generations (default: half the CPUs, capped by available memory)
 
     Usage:
         # Claude backend with databricks prompts
@@ -76,7 +72,7 @@ def main(
     if backend == "litellm":
         print(f"Model: {model}")
     print(f"Prompt set: {prompts}")
-    print(f"Max concurrency: {max_concurrency}")
+    print(f"Max concurrency: {max_concurrency or 'auto'}")
     print(f"MCP binary: {mcp_binary}")
     out_path = Path(output_dir) if output_dir else Path("./app")
     print(f"Output dir: {out_path}\n")
@@ -104,9 +100,9 @@ def main(
         pbar.set_description(f"{status} {app_name}")
         pbar.update(1)
 
-    try:
-        results = asyncio.run(
-            generator.generate_bulk(
+    async def generate():
+        async with generator:
+            return await generator.generate_bulk(
                 selected_prompts,
                 backend,
                 model,
@@ -114,10 +110,12 @@ def main(
                 max_concurrency,
                 on_complete=on_complete,
             )
-        )
+
+    try:
+        results = asyncio.run(generate())
     finally:
         pbar.close()
-        _restore_terminal_cursor()
+        restore_terminal_cursor()
 
     # separate successful and failed (results now include metrics)
     successful = [(name, app_dir, log, metrics) for name, app_dir, log, metrics, err in results if err is None]
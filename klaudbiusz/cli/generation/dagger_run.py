@@ -1,13 +1,17 @@
 """Dagger-based app generation pipeline with caching and parallelism."""
 
 import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
-import subprocess
+import shutil
 import sys
 from collections.abc import Callable
+from contextlib import AsyncExitStack
 from pathlib import Path
+from typing import Self
 
 import dagger
 
@@ -15,6 +19,44 @@ from cli.generation.codegen import GenerationMetrics
 
 logger = logging.getLogger(__name__)
 
+# host env vars passed through to the generation container
+_PASSTHROUGH_ENV_VARS = (
+    "ANTHROPIC_API_KEY",
+    "NEON_DATABASE_URL",
+)
+
+# sink for Dagger engine logs when they aren't streamed; shared by all connections
+_DEVNULL = open(os.devnull, "w")
+atexit.register(_DEVNULL.close)
+
+# rough peak memory of one generation container (agent + MCP server + node tooling)
+_GENERATION_MEM_BYTES = 1536 * 1024 * 1024
+
+
+def _available_memory_bytes() -> int | None:
+    """Return MemAvailable from /proc/meminfo, or None where it isn't available."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _compute_concurrency() -> int:
+    """Default number of parallel generations for this machine.
+
+    Half the CPUs, further capped by how many generation containers fit in the
+    currently available memory (Linux only; CPU bound alone elsewhere).
+    """
+    limit = max(1, (os.cpu_count() or 2) // 2)
+    available = _available_memory_bytes()
+    if available is not None:
+        limit = min(limit, max(1, available // _GENERATION_MEM_BYTES))
+    return limit
+
 
 def _read_metrics_from_app(app_dir: Path) -> GenerationMetrics | None:
     """Read metrics from generation_metrics.json in app directory."""
@@ -35,39 +77,73 @@ def _read_metrics_from_app(app_dir: Path) -> GenerationMetrics | None:
         return None
 
 
+def _remove_link(path: Path) -> None:
+    """Remove a symlink left at path; refuse to replace real files or directories."""
+    if path.is_symlink():
+        path.unlink()
+    elif path.exists():
+        raise FileExistsError(
+            f"{path} already exists and is not a link to a cached generation; "
+            "remove it or use a different app name"
+        )
+
+
+def _link_or_copy(target: Path, link: Path) -> None:
+    """Point link at target with a relative symlink, copying where symlinks aren't supported."""
+    try:
+        link.symlink_to(os.path.relpath(target, link.parent), target_is_directory=target.is_dir())
+    except OSError:
+        if target.is_dir():
+            shutil.copytree(target, link)
+        else:
+            shutil.copy2(target, link)
+
+
+_ELF_MAGIC = b"\x7fELF"
+_MACHO_MAGICS = (
+    b"\xfe\xed\xfa\xce",  # 32-bit
+    b"\xce\xfa\xed\xfe",  # 32-bit, little-endian
+    b"\xfe\xed\xfa\xcf",  # 64-bit
+    b"\xcf\xfa\xed\xfe",  # 64-bit, little-endian
+    b"\xca\xfe\xba\xbe",  # universal (fat) binary
+)
+
+
 def _check_binary_format(binary_path: Path) -> None:
     """Check if binary is Linux-compatible for container execution.
 
+    Reads the executable's magic number instead of shelling out to `file`.
+
     Raises:
-        RuntimeError: If binary is not Linux ELF format
+        RuntimeError: If binary is macOS format (Mach-O)
     """
     try:
-        result = subprocess.run(
-            ["file", str(binary_path)],
-            capture_output=True,
-            text=True,
-            check=True,
+        with open(binary_path, "rb") as f:
+            magic = f.read(4)
+    except OSError as e:
+        logger.warning(f"Could not read binary {binary_path} to check its format: {e}")
+        return
+
+    if magic in _MACHO_MAGICS:
+        raise RuntimeError(
+            f"Binary {binary_path} is macOS format (Mach-O), but Dagger runs Linux containers.\n"
+            f"Please provide a Linux build. For Go: GOOS=linux GOARCH=arm64 go build ..."
         )
-        output = result.stdout.lower()
 
-        if "mach-o" in output or "darwin" in output:
-            raise RuntimeError(
-                f"Binary {binary_path} is macOS format (Mach-O), but Dagger runs Linux containers.\n"
-                f"Please provide a Linux build. For Go: GOOS=linux GOARCH=arm64 go build ...\n"
-                f"Output from 'file': {result.stdout.strip()}"
-            )
-
-        if "elf" not in output:
-            logger.warning(
-                f"Binary {binary_path} may not be Linux-compatible: {result.stdout.strip()}"
-            )
-    except FileNotFoundError:
-        # 'file' command not available, skip check
-        pass
+    if magic != _ELF_MAGIC:
+        logger.warning(f"Binary {binary_path} may not be Linux-compatible: not an ELF executable")
 
 
 class DaggerAppGenerator:
-    """Runs app generation in Dagger container with caching."""
+    """Runs app generation in Dagger container with caching.
+
+    The Dagger connection and the built base container are kept across
+    generate_single/generate_bulk calls. Use as an async context manager
+    (or call aclose()) to close the connection:
+
+        async with DaggerAppGenerator(mcp_binary, output_dir) as generator:
+            await generator.generate_single(prompt, app_name)
+    """
 
     def __init__(
         self,
@@ -79,6 +155,83 @@ class DaggerAppGenerator:
         self.mcp_binary = mcp_binary
         self.output_dir = output_dir
         self.stream_logs = stream_logs
+        self._connection_stack: AsyncExitStack | None = None
+        self._client: dagger.Client | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._container_cache: dict[tuple, dagger.Container] = {}
+        self._context: dagger.Directory | None = None
+        self._mcp_binary_digest: bytes | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the Dagger connection (reopened on the next generation)."""
+        stack = self._connection_stack
+        self._connection_stack = None
+        self._client = None
+        self._loop = None
+        self._container_cache.clear()
+        self._context = None
+        if stack is not None:
+            await stack.aclose()
+
+    async def _get_client(self, quiet: bool = False) -> dagger.Client:
+        """Connect to Dagger on first use and reuse the connection afterwards.
+
+        The log output is fixed by whichever call opens the connection. Under
+        `dagger run` (DAGGER_SESSION_PORT set) the existing session is reused.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            # opened under a previous event loop (e.g. an earlier asyncio.run); unusable here
+            self._connection_stack = None
+            self._client = None
+            self._container_cache.clear()
+            self._context = None
+
+        if self._client is None:
+            if os.environ.get("DAGGER_SESSION_PORT"):
+                # inside `dagger run`: attach to the already running engine session
+                # instead of provisioning a new one (engine logs belong to `dagger run`)
+                connection = dagger.Connection()
+            elif self.stream_logs and not quiet:
+                connection = dagger.Connection(dagger.Config(log_output=sys.stderr))
+            else:
+                connection = dagger.Connection(dagger.Config(log_output=_DEVNULL))
+            stack = AsyncExitStack()
+            self._client = await stack.enter_async_context(connection)
+            self._connection_stack = stack
+            self._loop = loop
+        return self._client
+
+    def _container_cache_key(self) -> tuple:
+        """Host inputs baked into the base container; a change means a rebuild."""
+        def mtime_ns(path: Path) -> int | None:
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return None
+
+        return (
+            str(self.mcp_binary),
+            mtime_ns(self.mcp_binary),
+            tuple(os.environ.get(var) for var in _PASSTHROUGH_ENV_VARS),
+            mtime_ns(Path.home() / ".databrickscfg"),
+            mtime_ns(Path.home() / ".databricks"),
+        )
+
+    async def _get_container(self, client: dagger.Client) -> dagger.Container:
+        """Return the base container, building it only when its inputs changed."""
+        key = self._container_cache_key()
+        container = self._container_cache.get(key)
+        if container is None:
+            container = await self._build_container(client)
+            self._container_cache = {key: container}
+        return container
 
     async def generate_single(
         self,
@@ -87,23 +240,69 @@ class DaggerAppGenerator:
         backend: str = "claude",
         model: str | None = None,
         mcp_args: list[str] | None = None,
+        reuse_cached: bool = False,
     ) -> tuple[Path | None, Path, GenerationMetrics | None]:
         """Generate single app, export app dir + logs.
 
+        Args:
+            reuse_cached: link the app from an earlier generation with identical inputs
+                (prompt, backend, model, MCP args and binary) instead of running the
+                agent again; new generations are stored under output_dir/.cache. Opt-in
+                because agent runs aren't deterministic.
+
         Returns:
             tuple of (app_dir or None, log_file, metrics or None) paths on host.
             app_dir is None if agent didn't create an app.
         """
-        if self.stream_logs:
-            cfg = dagger.Config(log_output=sys.stderr)
-        else:
-            cfg = dagger.Config(log_output=open(os.devnull, "w"))
-        async with dagger.Connection(cfg) as client:
-            container = await self._build_container(client)
+        if not reuse_cached:
+            client = await self._get_client()
+            container = await self._get_container(client)
             return await self._run_generation(
                 client, container, prompt, app_name, backend, model, mcp_args
             )
 
+        cache_dir = self.output_dir / ".cache" / self._generation_cache_key(prompt, backend, model, mcp_args)
+        cached_log = cache_dir.with_suffix(".log")
+        app_dir_local = self.output_dir / app_name
+        log_file_local = self.output_dir / "logs" / f"{app_name}.log"
+        # links from an earlier cached run under this name would otherwise be written
+        # through (clobbering another cache entry) or collide with the new links
+        _remove_link(app_dir_local)
+        _remove_link(log_file_local)
+
+        if cache_dir.is_dir():
+            logger.info(f"Reusing cached generation {cache_dir.name} for {app_name}")
+            _link_or_copy(cache_dir, app_dir_local)
+            if cached_log.exists():
+                log_file_local.parent.mkdir(parents=True, exist_ok=True)
+                _link_or_copy(cached_log, log_file_local)
+            return app_dir_local, log_file_local, _read_metrics_from_app(cache_dir)
+
+        client = await self._get_client()
+        container = await self._get_container(client)
+        app_dir, log_file, metrics = await self._run_generation(
+            client, container, prompt, app_name, backend, model, mcp_args
+        )
+        if app_dir is not None:
+            # keep the result in the cache and leave links at the usual locations
+            cache_dir.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(app_dir, cache_dir)
+            shutil.move(log_file, cached_log)
+            _link_or_copy(cache_dir, app_dir)
+            _link_or_copy(cached_log, log_file)
+        return app_dir, log_file, metrics
+
+    def _generation_cache_key(
+        self, prompt: str, backend: str, model: str | None, mcp_args: list[str] | None
+    ) -> str:
+        """Content-addressed key for a generation's inputs."""
+        if self._mcp_binary_digest is None:
+            # hashed once per generator; the binary is large but doesn't change mid-run
+            with open(self.mcp_binary, "rb") as f:
+                self._mcp_binary_digest = hashlib.file_digest(f, hashlib.blake2b).digest()
+        inputs = json.dumps([prompt, backend, model, mcp_args or []]).encode()
+        return hashlib.blake2b(inputs + self._mcp_binary_digest, digest_size=8).hexdigest()
+
     async def _run_generation(
         self,
         client: dagger.Client,
@@ -147,15 +346,20 @@ class DaggerAppGenerator:
         log_file_local.parent.mkdir(parents=True, exist_ok=True)
 
         # capture stdout/stderr - even on failure we want to save what we can
+        # (sections are written one by one; logs can be large, so no concatenated copy is built)
         try:
-            log_content = await result.stdout()
-            stderr_content = await result.stderr()
-            full_log = f"{log_content}\n\n=== STDERR ===\n{stderr_content}" if stderr_content else log_content
-            log_file_local.write_text(full_log)
+            with log_file_local.open("w") as f:
+                f.write(await result.stdout())
+                stderr_content = await result.stderr()
+                if stderr_content:
+                    f.write("\n\n=== STDERR ===\n")
+                    f.write(stderr_content)
         except dagger.ExecError as e:
             # container command failed - save error output as log
-            full_log = f"=== EXEC ERROR ===\n{e}\n\n=== STDOUT ===\n{e.stdout}\n\n=== STDERR ===\n{e.stderr}"
-            log_file_local.write_text(full_log)
+            with log_file_local.open("w") as f:
+                f.writelines(
+                    ("=== EXEC ERROR ===\n", str(e), "\n\n=== STDOUT ===\n", e.stdout, "\n\n=== STDERR ===\n", e.stderr)
+                )
             raise
 
         # export app directory (if it exists)
@@ -178,7 +382,7 @@ class DaggerAppGenerator:
         backend: str = "claude",
         model: str | None = None,
         mcp_args: list[str] | None = None,
-        max_concurrency: int = 4,
+        max_concurrency: int | None = None,
         on_complete: Callable[[str, bool], None] | None = None,
     ) -> list[tuple[str, Path | None, Path | None, GenerationMetrics | None, str | None]]:
         """Generate multiple apps with Dagger parallelism.
@@ -191,57 +395,89 @@ class DaggerAppGenerator:
             backend: "claude" or "litellm"
             model: model name (required for litellm)
             mcp_args: optional MCP server args
-            max_concurrency: max parallel generations
+            max_concurrency: max parallel generations (default: derived from CPUs and available memory)
             on_complete: callback(app_name, success) called when each app finishes
 
         Returns:
-            list of (app_name, app_dir, log_file, metrics, error) tuples
+            list of (app_name, app_dir, log_file, metrics, error) tuples, in prompt order
         """
+        if max_concurrency is None:
+            max_concurrency = _compute_concurrency()
+            logger.info(f"Running up to {max_concurrency} generations in parallel")
+
         # suppress dagger output for bulk runs
-        cfg = dagger.Config(log_output=open(os.devnull, "w"))
-
-        async with dagger.Connection(cfg) as client:
-            # build container once, reuse for all generations
-            base_container = await self._build_container(client)
-            sem = asyncio.Semaphore(max_concurrency)
-
-            async def run_with_sem(
-                app_name: str, prompt: str
-            ) -> tuple[str, Path | None, Path | None, GenerationMetrics | None, str | None]:
-                async with sem:
-                    try:
-                        app_dir, log_file, metrics = await self._run_generation(
-                            client, base_container, prompt, app_name, backend, model, mcp_args
-                        )
-                        if on_complete:
-                            on_complete(app_name, True)
-                        return (app_name, app_dir, log_file, metrics, None)
-                    except Exception as e:
-                        if on_complete:
-                            on_complete(app_name, False)
-                        log_path = self.output_dir / "logs" / f"{app_name}.log"
-                        return (app_name, None, log_path if log_path.exists() else None, None, str(e))
-
-            tasks = [run_with_sem(name, prompt) for name, prompt in prompts.items()]
-            return await asyncio.gather(*tasks)
+        client = await self._get_client(quiet=True)
+        # build container once, reuse for all generations
+        base_container = await self._get_container(client)
+        sem = asyncio.Semaphore(max_concurrency)
+        results: list[tuple[str, Path | None, Path | None, GenerationMetrics | None, str | None] | None] = [
+            None
+        ] * len(prompts)
+
+        async def run_one(idx: int, app_name: str, prompt: str) -> None:
+            try:
+                app_dir, log_file, metrics = await self._run_generation(
+                    client, base_container, prompt, app_name, backend, model, mcp_args
+                )
+                if on_complete:
+                    on_complete(app_name, True)
+                results[idx] = (app_name, app_dir, log_file, metrics, None)
+            except Exception as e:
+                if on_complete:
+                    on_complete(app_name, False)
+                log_path = self.output_dir / "logs" / f"{app_name}.log"
+                results[idx] = (app_name, None, log_path if log_path.exists() else None, None, str(e))
+            finally:
+                sem.release()
+
+        # producer loop: a generation is only scheduled once a slot frees up, so
+        # large prompt sets don't hold thousands of pending tasks and Dagger pipelines
+        running: set[asyncio.Task] = set()
+        try:
+            for idx, (app_name, prompt) in enumerate(prompts.items()):
+                await sem.acquire()
+                task = asyncio.create_task(run_one(idx, app_name, prompt))
+                running.add(task)
+                task.add_done_callback(running.discard)
+            if running:
+                await asyncio.gather(*running)
+        except asyncio.CancelledError:
+            for task in running:
+                task.cancel()
+            raise
+        return results
 
     async def _build_container(self, client: dagger.Client) -> dagger.Container:
-        """Build container from Dockerfile with layer caching."""
-        # build context excluding generated files
-        context = client.host().directory(
-            ".",
-            exclude=[
-                "app/",
-                "app-eval/",
-                "results/",
-                ".venv/",
-                "__pycache__/",
-                ".git/",
-            ],
+        """Build container from Dockerfile with layer caching.
+
+        Host files are only referenced here; Dagger uploads them lazily and
+        concurrently when the container is first evaluated.
+        """
+        # check optional host config concurrently (may be on a slow home directory)
+        databrickscfg = Path.home() / ".databrickscfg"
+        databricks_dir = Path.home() / ".databricks"
+        has_databrickscfg, has_databricks_dir = await asyncio.gather(
+            asyncio.to_thread(databrickscfg.exists),
+            asyncio.to_thread(databricks_dir.exists),
         )
 
+        # build context excluding generated files; kept for the connection's lifetime
+        # so rebuilds (e.g. after the MCP binary changed) don't re-filter the tree
+        if self._context is None:
+            self._context = client.host().directory(
+                ".",
+                exclude=[
+                    "app/",
+                    "app-eval/",
+                    "results/",
+                    ".venv/",
+                    "__pycache__/",
+                    ".git/",
+                ],
+            )
+
         # build from Dockerfile (leverages BuildKit cache)
-        container = context.docker_build()
+        container = self._context.docker_build()
 
         # mount mcp binary from host (not baked into image)
         container = container.with_file(
@@ -251,18 +487,13 @@ class DaggerAppGenerator:
         )
 
         # pass through env vars from host
-        env_vars = [
-            "ANTHROPIC_API_KEY",
-            "NEON_DATABASE_URL",
-        ]
-        for var in env_vars:
+        for var in _PASSTHROUGH_ENV_VARS:
             if val := os.environ.get(var):
                 container = container.with_env_variable(var, val)
 
         # mount databricks config for CLI authentication (OAuth profile)
         # container runs as 'klaudbiusz' user (see Dockerfile)
-        databrickscfg = Path.home() / ".databrickscfg"
-        if databrickscfg.exists():
+        if has_databrickscfg:
             container = container.with_file(
                 "/home/klaudbiusz/.databrickscfg",
                 client.host().file(str(databrickscfg)),
@@ -271,8 +502,7 @@ class DaggerAppGenerator:
 
         # mount databricks directory for OAuth token cache and other CLI state
         # required when using auth_type = databricks-cli
-        databricks_dir = Path.home() / ".databricks"
-        if databricks_dir.exists():
+        if has_databricks_dir:
             container = container.with_directory(
                 "/home/klaudbiusz/.databricks",
                 client.host().directory(str(databricks_dir)),
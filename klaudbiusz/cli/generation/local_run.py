@@ -1,6 +1,6 @@
 """Single app generation without Dagger (runs locally)."""
 
-from datetime import datetime
+import time
 from pathlib import Path
 
 import fire
@@ -49,7 +49,8 @@ def run(
         raise ValueError("--model is required when using --backend=litellm")
 
     if app_name is None:
-        app_name = f"app-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        # nanosecond timestamp in hex: sorts chronologically, no same-second collisions
+        app_name = f"app-{time.time_ns():x}"
 
     resolved_output_dir = Path(output_dir) if output_dir else Path("./app")
 
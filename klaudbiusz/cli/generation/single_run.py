@@ -1,23 +1,18 @@
 """Single app generation via Dagger."""
 
 import asyncio
-import os
-from datetime import datetime
+import time
 from pathlib import Path
 
 import fire
 from dotenv import load_dotenv
 
 from cli.generation.dagger_run import DaggerAppGenerator
+from cli.utils.shared import restore_terminal_cursor
 
 load_dotenv()
 
 
-def _restore_terminal_cursor() -> None:
-    """Restore terminal cursor after Dagger run (workaround for dagger/dagger#7160)."""
-    os.system("tput cnorm 2>/dev/null || true")
-
-
 def run(
     prompt: str,
     app_name: str | None = None,
@@ -26,6 +21,7 @@ def run(
     mcp_binary: str | None = None,
     mcp_args: list[str] | None = None,
     output_dir: str | None = None,
+    reuse_cached: bool = False,
 ) -> dict[str, str | None]:
     """Run app generation in Dagger container.
 
@@ -36,6 +32,8 @@ def run(
         model: LLM model (required if backend=litellm)
         mcp_binary: Path to edda_mcp binary (required)
         mcp_args: Optional list of args passed to the MCP server
+        reuse_cached: Link the app from an earlier run with the same prompt, backend, model,
+            MCP args and binary instead of generating it again
 
     Usage:
         # Claude backend (default)
@@ -46,6 +44,12 @@ def run(
 
         # Custom MCP args
         python single_run.py "build dashboard" --mcp_binary=/path/to/edda_mcp --mcp_args='["experimental", "apps-mcp"]'
+
+        # Re-running an identical generation returns the cached app
+        python single_run.py "build dashboard" --mcp_binary=/path/to/edda_mcp --reuse_cached
+
+        # Reuse one engine session across several generations
+        dagger run sh -c 'python single_run.py "build dashboard" --mcp_binary=... && python single_run.py ...'
     """
     if not mcp_binary:
         raise ValueError("--mcp_binary is required")
@@ -54,19 +58,24 @@ def run(
         raise ValueError("--model is required when using --backend=litellm")
 
     if app_name is None:
-        app_name = f"app-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        # nanosecond timestamp in hex: sorts chronologically, no same-second collisions
+        app_name = f"app-{time.time_ns():x}"
 
     generator = DaggerAppGenerator(
         mcp_binary=Path(mcp_binary),
         output_dir=Path(output_dir) if output_dir else Path("./app"),
     )
 
+    async def generate():
+        async with generator:
+            return await generator.generate_single(
+                prompt, app_name, backend, model, mcp_args, reuse_cached=reuse_cached
+            )
+
     try:
-        app_dir, log_file, metrics = asyncio.run(
-            generator.generate_single(prompt, app_name, backend, model, mcp_args)
-        )
+        app_dir, log_file, metrics = asyncio.run(generate())
     finally:
-        _restore_terminal_cursor()
+        restore_terminal_cursor()
 
     print(f"\n{'=' * 80}")
     if app_dir:
@@ -0,0 +1,12 @@
+"""Coverage summary row matching for test runner output."""
+
+import re
+
+# Coverage summary row, e.g. "All files |   85.71 % |   70.00 % | ..." (Jest/Vitest/node --test):
+# a line containing "all files" (any case) and a percentage
+COVERAGE_ROW_RE = re.compile(r"^(?=.*%).*all files.*$", re.IGNORECASE | re.MULTILINE)
+
+
+def is_coverage_row(line: str) -> bool:
+    """Check whether a single output line is the coverage summary row."""
+    return COVERAGE_ROW_RE.search(line) is not None
@@ -2,75 +2,185 @@
 
 Provides the same interface as Workspace but uses subprocess calls to docker CLI.
 Useful for environments that have Docker but not Dagger (e.g., Databricks Jobs).
+
+When the Docker SDK is installed, commands are executed through a persistent
+Docker API connection instead of spawning a `docker exec` process per command.
 """
 
+import codecs
+import io
 import logging
+import posixpath
 import subprocess
+import tarfile
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Self
+from typing import Callable, Self
 
 from cli.utils.dagger_utils import ExecResult
 
+try:
+    import docker
+    import requests
+except ImportError:
+    docker = None
+
 logger = logging.getLogger(__name__)
 
 
+class _LineTail:
+    """Split a byte stream into lines, keeping only the last `maxlen` of them."""
+
+    def __init__(self, maxlen: int, on_line: Callable[[str], None] | None = None):
+        self.lines: deque[str] = deque(maxlen=maxlen)
+        self._on_line = on_line
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+
+    def feed(self, chunk: bytes) -> None:
+        *complete, self._partial = (self._partial + self._decoder.decode(chunk)).split("\n")
+        for line in complete:
+            self._emit(line)
+
+    def close(self) -> str:
+        """Flush any unterminated last line and return the retained tail."""
+        rest = self._partial + self._decoder.decode(b"", final=True)
+        if rest:
+            self._emit(rest)
+        self._partial = ""
+        return "\n".join(self.lines)
+
+    def _emit(self, line: str) -> None:
+        self.lines.append(line)
+        if self._on_line is not None:
+            self._on_line(line)
+
+
+def _tar_info(name: str, mode: int) -> tarfile.TarInfo:
+    """Tar entry owned by root, timestamped now."""
+    info = tarfile.TarInfo(name)
+    info.mode = mode
+    info.mtime = int(time.time())
+    info.uname = info.gname = "root"
+    return info
+
+
+# Cleared once the daemon rejects a CPU set (e.g. a cpuset-restricted host whose
+# allowed CPU ids don't start at 0); later containers are then left unpinned
+_cpu_pinning_supported = True
+
+
+def _limit_flags(cpuset_cpus: str | None, memory_bytes: int | None) -> list[str]:
+    """docker run/update flags for CPU pinning and memory limits."""
+    flags = []
+    if cpuset_cpus:
+        flags.extend(["--cpuset-cpus", cpuset_cpus])
+    if memory_bytes:
+        flags.extend(["--memory", str(memory_bytes), "--memory-swap", str(memory_bytes)])
+    return flags
+
+
+def _pump(pipe, tail: _LineTail) -> None:
+    """Feed a subprocess pipe into a line tail until EOF."""
+    for chunk in pipe:
+        tail.feed(chunk)
+
+
 class DockerWorkspace:
     """Docker-based workspace using docker CLI instead of Dagger."""
 
-    def __init__(self, container_id: str, container_name: str, workdir: str = "/app"):
+    def __init__(
+        self,
+        container_id: str,
+        container_name: str,
+        workdir: str = "/app",
+        env_vars: dict[str, str] | None = None,
+    ):
         self.container_id = container_id
         self.container_name = container_name
         self.workdir = workdir
+        # Passed with every exec; used when the container was started without per-app env (e.g. pooled)
+        self.env_vars = env_vars or {}
+        # Docker API client, created on first exec and reused for the container's lifetime
+        self._api = None
+        self._use_sdk = docker is not None
 
     @classmethod
     def create(
         cls,
-        app_dir: Path,
+        app_dir: Path | None,
         base_image: str = "node:20-alpine",
         port: int = 8000,
         env_vars: dict[str, str] | None = None,
+        cpuset_cpus: str | None = None,
+        memory_bytes: int | None = None,
     ) -> Self:
         """Create and start a Docker container for evaluation.
 
         Args:
-            app_dir: Path to the app directory on host
+            app_dir: Path to the app directory on host, bind-mounted at /app.
+                     If None, /app starts empty (used for pooled containers).
             base_image: Docker base image (default: node:20-alpine)
             port: Port to expose for the app
             env_vars: Environment variables to set in container
+            cpuset_cpus: Optional CPUs to pin the container to (e.g. "0-3")
+            memory_bytes: Optional memory limit (swap disabled)
 
         Returns:
             DockerWorkspace instance with running container
         """
         # Generate unique container name
-        container_name = f"eval-{app_dir.name}-{port}-{uuid.uuid4().hex[:8]}"
-
-        # Build docker run command
-        # --privileged needed for Databricks (proc mount, AppArmor bypasses)
-        cmd = [
-            "docker", "run", "-d",
-            "--name", container_name,
-            "-v", f"{app_dir.resolve()}:/app",
-            "-w", "/app",
-            "--privileged",
-        ]
-
-        # Add environment variables
-        env_vars = env_vars or {}
-        for key, value in env_vars.items():
-            if value:  # Only add non-empty values
-                cmd.extend(["-e", f"{key}={value}"])
-
-        # Add image and keep-alive command
-        cmd.extend([
-            base_image,
-            "tail", "-f", "/dev/null"  # Keep container running
-        ])
-
-        logger.debug(f"Starting container: {' '.join(cmd)}")
+        prefix = app_dir.name if app_dir else "pool"
+        container_name = f"eval-{prefix}-{port}-{uuid.uuid4().hex[:8]}"
+
+        global _cpu_pinning_supported
+        if not _cpu_pinning_supported:
+            cpuset_cpus = None
+
+        def run_cmd(cpuset_cpus: str | None) -> list[str]:
+            # Build docker run command
+            # --privileged needed for Databricks (proc mount, AppArmor bypasses)
+            cmd = [
+                "docker", "run", "-d",
+                "--name", container_name,
+            ]
+            if app_dir:
+                cmd.extend(["-v", f"{app_dir.resolve()}:/app"])
+            cmd.extend([
+                "-w", "/app",
+                "--privileged",
+            ])
+            cmd.extend(_limit_flags(cpuset_cpus, memory_bytes))
+
+            # Add environment variables
+            for key, value in (env_vars or {}).items():
+                if value:  # Only add non-empty values
+                    cmd.extend(["-e", f"{key}={value}"])
+
+            # Add image and keep-alive command
+            cmd.extend([
+                base_image,
+                "tail", "-f", "/dev/null"  # Keep container running
+            ])
+            logger.debug(f"Starting container: {' '.join(cmd)}")
+            return cmd
 
         # Start container
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        result = subprocess.run(run_cmd(cpuset_cpus), capture_output=True, text=True, timeout=60)
+        if result.returncode != 0 and cpuset_cpus:
+            # The requested CPU ids may not be available to the daemon; start unpinned
+            logger.warning(
+                f"Failed to start {container_name} pinned to CPUs {cpuset_cpus}, "
+                f"retrying without pinning: {result.stderr.strip()}"
+            )
+            subprocess.run(["docker", "rm", "-f", container_name], capture_output=True, timeout=30)
+            result = subprocess.run(run_cmd(None), capture_output=True, text=True, timeout=60)
+            if result.returncode == 0:
+                _cpu_pinning_supported = False
         if result.returncode != 0:
             raise RuntimeError(f"Failed to start container: {result.stderr}")
 
@@ -90,6 +200,7 @@ class DockerWorkspace:
         command: list[str],
         cwd: str | None = None,
         timeout: int = 300,
+        env: dict[str, str] | None = None,
     ) -> ExecResult:
         """Execute command in container using docker exec.
 
@@ -97,21 +208,27 @@ class DockerWorkspace:
             command: Command to execute (as list of strings)
             cwd: Working directory (default: container workdir)
             timeout: Timeout in seconds
+            env: Extra environment variables for this command only (passed as
+                `docker exec -e`; override the workspace's env vars)
 
         Returns:
             ExecResult with exit code, stdout, stderr
         """
         workdir = cwd or self.workdir
+        env = self._command_env(env)
 
-        docker_cmd = [
-            "docker", "exec",
-            "-w", workdir,
-            self.container_id,
-        ] + command
+        api = self._get_api()
+        if api is not None:
+            stdout, stderr = bytearray(), bytearray()
+            exit_code, error = self._exec_api(api, command, workdir, env, timeout, stdout.extend, stderr.extend)
+            stderr_text = stderr.decode(errors="replace")
+            if error:
+                stderr_text = f"{stderr_text}\n{error}" if stderr_text else error
+            return ExecResult(exit_code=exit_code, stdout=stdout.decode(errors="replace"), stderr=stderr_text)
 
         try:
             result = subprocess.run(
-                docker_cmd,
+                self._exec_cmd(command, workdir, env),
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -128,24 +245,200 @@ class DockerWorkspace:
                 stderr=f"Command timed out after {timeout}s",
             )
 
+    def exec_stream(
+        self,
+        command: list[str],
+        cwd: str | None = None,
+        timeout: int = 300,
+        on_line: Callable[[str], None] | None = None,
+        tail_lines: int = 200,
+        env: dict[str, str] | None = None,
+    ) -> ExecResult:
+        """Execute command in container, streaming output instead of buffering it.
+
+        Memory stays constant regardless of how much the command prints, which
+        matters for chatty installs and test runners evaluated in parallel.
+
+        Args:
+            command: Command to execute (as list of strings)
+            cwd: Working directory (default: container workdir)
+            timeout: Timeout in seconds
+            env: Extra environment variables for this command only (passed as
+                `docker exec -e`; override the workspace's env vars)
+            on_line: Called with every output line (stdout and stderr, possibly
+                from a reader thread)
+            tail_lines: Number of trailing lines of each stream to keep
+
+        Returns:
+            ExecResult with exit code and the last `tail_lines` of stdout/stderr
+        """
+        workdir = cwd or self.workdir
+        env = self._command_env(env)
+        stdout = _LineTail(tail_lines, on_line)
+        stderr = _LineTail(tail_lines, on_line)
+        error = None
+
+        api = self._get_api()
+        if api is not None:
+            exit_code, error = self._exec_api(api, command, workdir, env, timeout, stdout.feed, stderr.feed)
+        else:
+            proc = subprocess.Popen(self._exec_cmd(command, workdir, env), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            # One reader thread per pipe so neither can fill up and block the command
+            readers = [
+                threading.Thread(target=_pump, args=(proc.stdout, stdout), daemon=True),
+                threading.Thread(target=_pump, args=(proc.stderr, stderr), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+            try:
+                exit_code = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                exit_code, error = 124, f"Command timed out after {timeout}s"  # Standard timeout exit code
+            for reader in readers:
+                reader.join()
+
+        stderr_tail = stderr.close()
+        if error:
+            stderr_tail = f"{stderr_tail}\n{error}" if stderr_tail else error
+        return ExecResult(exit_code=exit_code, stdout=stdout.close(), stderr=stderr_tail)
+
+    def _command_env(self, env: dict[str, str] | None) -> dict[str, str]:
+        """Workspace env vars (empty ones dropped), overridden by per-command env."""
+        merged = {key: value for key, value in self.env_vars.items() if value}
+        if env:
+            merged.update(env)
+        return merged
+
+    def _exec_cmd(self, command: list[str], workdir: str, env: dict[str, str]) -> list[str]:
+        """Build the `docker exec` argv for running command in the container."""
+        docker_cmd = ["docker", "exec", "-w", workdir]
+        for key, value in env.items():
+            docker_cmd.extend(["-e", f"{key}={value}"])
+        docker_cmd.append(self.container_id)
+        docker_cmd.extend(command)
+        return docker_cmd
+
+    def _get_api(self):
+        """Get the Docker API client, or None to fall back to the docker CLI.
+
+        The daemon is pinged once, so a client that can't reach the daemon the
+        CLI uses (e.g. a `docker context` socket) falls back instead of failing.
+        """
+        if self._api is None and self._use_sdk:
+            client = None
+            try:
+                client = docker.from_env(timeout=10)
+                client.ping()
+            except (docker.errors.DockerException, requests.exceptions.RequestException) as e:
+                logger.debug(f"Docker SDK can't reach the daemon, using docker CLI: {e}")
+                self._use_sdk = False
+                if client is not None:
+                    client.close()
+            else:
+                self._api = client.api
+                # socket timeouts only bound gaps between reads; _exec_api enforces deadlines
+                self._api.timeout = None
+        return self._api
+
+    def _exec_api(
+        self,
+        api,
+        command: list[str],
+        workdir: str,
+        env: dict[str, str],
+        timeout: int,
+        on_stdout: Callable[[bytes], None],
+        on_stderr: Callable[[bytes], None],
+    ) -> tuple[int, str | None]:
+        """Execute command over the Docker API (exec create + start + inspect).
+
+        Output chunks are passed to on_stdout/on_stderr as they arrive. The exec
+        runs in a worker thread so the caller stops waiting at the wall-clock
+        deadline; as with a killed `docker exec` client, the process in the
+        container keeps running.
+
+        API errors are returned as a failed command. A lost connection also
+        switches this workspace to the docker CLI; other errors are raised.
+
+        Returns:
+            (exit code, error message or None)
+        """
+        lock = threading.Lock()
+        abandoned = False
+        outcome: Future[tuple[int, str | None]] = Future()
+
+        def run() -> None:
+            try:
+                exec_id = api.exec_create(
+                    self.container_id, command, workdir=workdir, environment=env or None
+                )["Id"]
+                for out_chunk, err_chunk in api.exec_start(exec_id, stream=True, demux=True):
+                    with lock:
+                        if abandoned:
+                            return
+                        if out_chunk:
+                            on_stdout(out_chunk)
+                        if err_chunk:
+                            on_stderr(err_chunk)
+                exit_code = api.exec_inspect(exec_id)["ExitCode"]
+                outcome.set_result((exit_code if exit_code is not None else 1, None))
+            except docker.errors.APIError as e:
+                outcome.set_result((1, str(e)))
+            except BaseException as e:
+                # re-raised in the calling thread
+                outcome.set_exception(e)
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout)
+        with lock:
+            if not outcome.done():
+                abandoned = True
+                # the worker may still be blocked on this client's connection:
+                # close the client and reconnect on the next command
+                self._close_api()
+                return 124, f"Command timed out after {timeout}s"  # Standard timeout exit code
+        try:
+            return outcome.result()
+        except requests.exceptions.ConnectionError as e:
+            # the daemon is no longer reachable over the SDK; use the docker CLI from now on
+            logger.warning(f"Docker API connection lost, using docker CLI: {e}")
+            self._close_api()
+            self._use_sdk = False
+            return 1, f"Docker API connection failed: {e}"
+
+    def _close_api(self) -> None:
+        """Close the Docker API client, if any; the next command reconnects."""
+        if self._api is not None:
+            self._api.close()
+            self._api = None
+
     def write_file(self, path: str, contents: str) -> Self:
         """Write a file to the container.
 
+        Contents are sent as a tar archive to `docker cp -`, so they are written
+        verbatim (no shell quoting) and missing parent directories are created.
+
         Args:
-            path: File path in container
+            path: File path in container (relative paths are relative to the workdir)
             contents: File contents
 
         Returns:
             Self for chaining
         """
-        # Use docker exec with bash to write file
-        # Escape single quotes in contents
-        escaped = contents.replace("'", "'\"'\"'")
-        cmd = ["docker", "exec", self.container_id, "bash", "-c", f"cat > '{path}' << 'EOFMARKER'\n{contents}\nEOFMARKER"]
+        data = contents.encode()
+        # The archive is extracted at /, so anchor relative paths at the workdir like `docker exec` does
+        name = posixpath.normpath(posixpath.join(self.workdir, path)).lstrip("/")
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            logger.warning(f"Failed to write file {path}: {result.stderr}")
+        def add_file(tar: tarfile.TarFile) -> None:
+            info = _tar_info(name, mode=0o644)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+        if error := self._put_archive(add_file):
+            logger.warning(f"Failed to write file {path}: {error}")
 
         return self
 
@@ -166,6 +459,125 @@ class DockerWorkspace:
 
         return self
 
+    def write_files(self, files: dict[str, bytes], dest_dir: str, mode: int = 0o644) -> Self:
+        """Write files into a container directory with a single `docker cp`.
+
+        The files are streamed to `docker cp -` as a tar archive, which also
+        creates dest_dir, instead of running one docker command per file.
+
+        Args:
+            files: File name -> contents
+            dest_dir: Destination directory in container (relative to the workdir unless absolute)
+            mode: Permission bits for the written files
+
+        Returns:
+            Self for chaining
+        """
+        root = posixpath.normpath(posixpath.join(self.workdir, dest_dir)).lstrip("/")
+
+        def add_files(tar: tarfile.TarFile) -> None:
+            dir_info = _tar_info(root, mode=0o755)
+            dir_info.type = tarfile.DIRTYPE
+            tar.addfile(dir_info)
+            for name, data in files.items():
+                info = _tar_info(f"{root}/{name}", mode=mode)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+        if error := self._put_archive(add_files):
+            logger.warning(f"Failed to write files to {dest_dir}: {error}")
+
+        return self
+
+    def _put_archive(self, add_entries: Callable[[tarfile.TarFile], None], timeout: int = 30) -> str | None:
+        """Stream a tar archive into the container root via `docker cp -`.
+
+        Args:
+            add_entries: Adds entries (paths relative to /) to the archive
+            timeout: Timeout in seconds
+
+        Returns:
+            None on success, otherwise docker's error output
+        """
+        proc = subprocess.Popen(
+            ["docker", "cp", "-", f"{self.container_id}:/"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                add_entries(tar)
+        except BrokenPipeError:
+            pass  # docker cp exited early; its stderr is reported below
+        finally:
+            proc.stdin.close()
+
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        stderr = proc.stderr.read().decode(errors="replace")
+        proc.stderr.close()
+        if proc.returncode != 0:
+            return stderr or f"docker cp exited with {proc.returncode}"
+        return None
+
+    def copy_dir(self, src: Path, dest: str) -> Self:
+        """Copy the contents of a host directory into the container.
+
+        Args:
+            src: Source directory on host
+            dest: Destination directory in container (must exist)
+
+        Returns:
+            Self for chaining
+        """
+        cmd = ["docker", "cp", f"{src}/.", f"{self.container_id}:{dest}"]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to copy {src} to {dest}: {result.stderr}")
+
+        return self
+
+    def set_limits(self, cpuset_cpus: str | None = None, memory_bytes: int | None = None) -> Self:
+        """Update CPU pinning / memory limit of the running container.
+
+        Args:
+            cpuset_cpus: CPUs to pin the container to (e.g. "0-3")
+            memory_bytes: Memory limit (swap disabled)
+
+        Returns:
+            Self for chaining
+        """
+        global _cpu_pinning_supported
+        if not _cpu_pinning_supported:
+            cpuset_cpus = None
+        flags = _limit_flags(cpuset_cpus, memory_bytes)
+        if not flags:
+            return self
+        cmd = ["docker", "update", *flags, self.container_id]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        if result.returncode != 0 and cpuset_cpus:
+            # The requested CPU ids may not be available to the daemon; leave it unpinned
+            logger.warning(
+                f"Failed to pin {self.container_name} to CPUs {cpuset_cpus}, "
+                f"continuing without pinning: {result.stderr.strip()}"
+            )
+            retry_flags = _limit_flags(None, memory_bytes)
+            if not retry_flags:
+                _cpu_pinning_supported = False
+                return self
+            cmd = ["docker", "update", *retry_flags, self.container_id]
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            if result.returncode == 0:
+                _cpu_pinning_supported = False
+        if result.returncode != 0:
+            logger.warning(f"Failed to update limits of {self.container_name}: {result.stderr}")
+
+        return self
+
     def cleanup(self) -> None:
         """Stop and remove the container."""
         try:
@@ -177,6 +589,8 @@ class DockerWorkspace:
             logger.debug(f"Removed container {self.container_name}")
         except Exception as e:
             logger.warning(f"Failed to remove container {self.container_name}: {e}")
+        finally:
+            self._close_api()
 
     def __enter__(self) -> Self:
         return self
@@ -0,0 +1,21 @@
+"""Eval scripts shipped with the CLI (cli/eval/<template>/*.sh)."""
+
+from functools import cache
+from pathlib import Path
+
+EVAL_DIR = Path(__file__).parent.parent / "eval"
+
+
+@cache
+def get_eval_scripts(template: str) -> dict[str, bytes]:
+    """
+    Get the template's eval scripts (cli/eval/<template>/*.sh), read once per process.
+
+    Args:
+        template: Template type ("dbx-sdk", "trpc", "vite", or "docker")
+
+    Returns:
+        Dictionary of script name -> contents, sorted by name (empty if the
+        template has no eval directory). Shared between callers; don't mutate.
+    """
+    return {path.name: path.read_bytes() for path in sorted((EVAL_DIR / template).glob("*.sh"))}
@@ -9,11 +9,25 @@ Also suppresses verbose INFO logs that create duplicates due to handler conflict
 """
 
 import logging
+import sys
+
+_PATCHED = False
 
 
 def patch_litellm_for_multiprocessing():
-    """Disable litellm's async logging worker to prevent event loop issues."""
-    import litellm
+    """Disable litellm's async logging worker to prevent event loop issues.
+
+    Applied once per process, and only to an already imported litellm: the
+    patch never triggers litellm's slow import itself. Import litellm in the
+    parent before forking so workers inherit the patched module.
+    """
+    global _PATCHED
+    if _PATCHED:
+        return
+    litellm = sys.modules.get("litellm")
+    if litellm is None:
+        return  # not imported yet; call again after `import litellm`
+    _PATCHED = True
 
     # disable all callback infrastructure
     litellm.turn_off_message_logging = True
@@ -99,14 +99,8 @@ class EvaluationTracker:
         try:
             run = mlflow.start_run(run_name=run_name)
 
-            # Add default tags
-            mlflow.set_tag("framework", "klaudbiusz")
-            mlflow.set_tag("run_name", run_name)
-
-            # Add custom tags
-            if tags:
-                for key, value in tags.items():
-                    mlflow.set_tag(key, value)
+            # Default tags plus custom tags, sent in one batch
+            mlflow.set_tags({"framework": "klaudbiusz", "run_name": run_name, **(tags or {})})
 
             return run.info.run_id
         except Exception as e:
@@ -133,15 +127,12 @@ class EvaluationTracker:
             return
 
         try:
-            mlflow.log_param("mode", mode)
-            mlflow.log_param("total_apps", total_apps)
-            mlflow.log_param("timestamp", timestamp)
-
+            params = {"mode": mode, "total_apps": total_apps, "timestamp": timestamp}
             if model_version:
-                mlflow.log_param("model_version", model_version)
+                params["model_version"] = model_version
+            params.update(kwargs)
 
-            for key, value in kwargs.items():
-                mlflow.log_param(key, value)
+            mlflow.log_params(params)
 
         except Exception as e:
             print(f"⚠️  Failed to log parameters: {e}")
@@ -158,16 +149,18 @@ class EvaluationTracker:
 
         try:
             summary = evaluation_report.get('summary', {})
+            # Aggregates are collected and sent in a single log_metrics batch
+            batch: Dict[str, float] = {}
 
             # Log only top-level aggregate metrics (appeval_100 + 2-3 key metrics)
             total_apps = summary.get('total_apps', 0)
             if total_apps > 0:
-                mlflow.log_metric("total_apps", total_apps)
+                batch["total_apps"] = total_apps
 
             # Log template distribution metrics
             template_dist = summary.get('template_distribution', {})
             for template_name, count in template_dist.items():
-                mlflow.log_metric(f"template_{template_name}_count", count)
+                batch[f"template_{template_name}_count"] = count
 
             # Log average scores from individual apps
             apps = evaluation_report.get('apps', [])
@@ -175,15 +168,20 @@ class EvaluationTracker:
                 # Average appeval_100 composite score (PRIMARY METRIC)
                 avg_appeval_100 = sum(app['metrics'].get('appeval_100', 0)
                                      for app in apps) / len(apps)
-                mlflow.log_metric("avg_appeval_100", avg_appeval_100)
+                batch["avg_appeval_100"] = avg_appeval_100
 
                 # Average eff_units efficiency metric (lower is better)
                 eff_values = [app['metrics'].get('eff_units') for app in apps
                              if app.get('metrics', {}).get('eff_units') is not None]
                 if eff_values:
                     avg_eff_units = sum(eff_values) / len(eff_values)
-                    mlflow.log_metric("avg_eff_units", avg_eff_units)
+                    batch["avg_eff_units"] = avg_eff_units
+
+            # Log the aggregates before the table, so they aren't lost if the table fails
+            if batch:
+                mlflow.log_metrics(batch)
 
+            if apps:
                 # Log per-app detailed metrics as MLflow Table
                 # Mapping internal names to standard names from Databricks Apps 2.0 spec
                 metric_name_mapping = {
@@ -238,19 +236,23 @@ class EvaluationTracker:
             return
 
         try:
+            batch: Dict[str, float] = {}
             if 'cost_usd' in generation_metrics:
-                mlflow.log_metric("generation_cost_usd", generation_metrics['cost_usd'])
+                batch["generation_cost_usd"] = generation_metrics['cost_usd']
 
             if 'total_output_tokens' in generation_metrics:
-                mlflow.log_metric("total_output_tokens", generation_metrics['total_output_tokens'])
+                batch["total_output_tokens"] = generation_metrics['total_output_tokens']
 
             if 'avg_turns' in generation_metrics:
-                mlflow.log_metric("avg_turns_per_app", generation_metrics['avg_turns'])
+                batch["avg_turns_per_app"] = generation_metrics['avg_turns']
 
             # Cost efficiency: apps per dollar
             if 'cost_usd' in generation_metrics and generation_metrics['cost_usd'] > 0:
                 apps_per_dollar = generation_metrics.get('total_apps', 0) / generation_metrics['cost_usd']
-                mlflow.log_metric("apps_per_dollar", apps_per_dollar)
+                batch["apps_per_dollar"] = apps_per_dollar
+
+            if batch:
+                mlflow.log_metrics(batch)
 
         except Exception as e:
             print(f"⚠️  Failed to log generation metrics: {e}")
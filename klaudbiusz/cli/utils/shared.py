@@ -3,17 +3,32 @@
 Contains:
 - Tracker: Unified logging and trajectory collection
 - Shared data structures and helpers
-- Environment detection utilities
+- Environment detection and terminal utilities
 """
 
 import json
 import logging
 import os
+import sys
 
 
 def is_databricks_environment() -> bool:
     """Detect if running in a Databricks environment."""
     return os.path.exists("/databricks") or "DATABRICKS_RUNTIME_VERSION" in os.environ
+
+
+def restore_terminal_cursor() -> None:
+    """Restore terminal cursor after Dagger run (workaround for dagger/dagger#7160).
+
+    Writes the show-cursor escape directly instead of forking a shell for
+    `tput cnorm`; nothing is written when stderr isn't a terminal.
+    """
+    try:
+        if sys.stderr.isatty():
+            sys.stderr.write("\x1b[?25h")
+            sys.stderr.flush()
+    except (OSError, ValueError):
+        pass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -5,6 +5,7 @@ Automatically identifies which template/SDK was used to generate an app
 by examining the app structure and key files.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -26,12 +27,29 @@ def detect_template(app_dir: Path) -> str:
     """
     Detect which template was used to generate the app.
 
+    Results are cached per directory and recomputed when the directory's mtime
+    changes (i.e. when top-level entries are added, removed or renamed).
+
     Args:
         app_dir: Path to the application directory
 
     Returns:
         Template type: "dbx-sdk", "trpc", "vite", "python", or "unknown"
     """
+    try:
+        mtime_ns = app_dir.stat().st_mtime_ns
+    except OSError:
+        return _detect_template(app_dir)
+    return _detect_template_cached(str(app_dir), mtime_ns)
+
+
+# mtime_ns is unused in the body; it is only part of the cache key
+@lru_cache(maxsize=1024)
+def _detect_template_cached(app_dir: str, mtime_ns: int) -> str:
+    return _detect_template(Path(app_dir))
+
+
+def _detect_template(app_dir: Path) -> str:
     # Handle nested app directories (e.g., app_name/app_name/package.json)
     app_dir = get_actual_app_dir(app_dir)
 
@@ -4,11 +4,14 @@ This module provides utilities to create Dagger workspaces configured for
 evaluating TypeScript applications (tRPC, DBX-SDK, or Docker-based).
 """
 
+import os
+import time
 from pathlib import Path
 import dagger
 
 from cli.utils.workspace import Workspace
 from cli.utils.dagger_utils import ExecResult
+from cli.utils.eval_scripts import get_eval_scripts
 
 
 async def create_ts_workspace(
@@ -29,7 +32,8 @@ async def create_ts_workspace(
         Workspace configured with Node.js, app files, and eval scripts
     """
 
-    # Load app directory as Dagger Directory (exclude node_modules to force clean install)
+    # Load app directory as Dagger Directory (exclude node_modules to force clean install;
+    # package downloads are served from the npm cache volume mounted below)
     app_context = client.host().directory(
         str(app_dir),
         exclude=["node_modules", "**/node_modules", "**/.next", "**/dist", "**/build"]
@@ -52,36 +56,35 @@ async def create_ts_workspace(
         setup_cmd=setup_cmds,
     )
 
-    # Copy all eval scripts into container
-    eval_dir = Path(__file__).parent.parent / "eval" / template
-
-    # Copy all .sh files from eval directory
-    if eval_dir.exists():
-        for script_path in eval_dir.glob("*.sh"):
-            script_name = script_path.name
-            content = script_path.read_text()
-            workspace = workspace.write_file(f"/eval/{script_name}", content, force=True)
-
-    # Set environment variables for evaluation
-    import os
-
-    # Pass Databricks credentials from host environment
-    databricks_host = os.getenv("DATABRICKS_HOST", "")
-    databricks_token = os.getenv("DATABRICKS_TOKEN", "")
-    databricks_warehouse_id = os.getenv("DATABRICKS_WAREHOUSE_ID", "")
-
-    if databricks_host:
-        workspace.ctr = workspace.ctr.with_env_variable("DATABRICKS_HOST", databricks_host)
-    if databricks_token:
-        workspace.ctr = workspace.ctr.with_env_variable("DATABRICKS_TOKEN", databricks_token)
-    if databricks_warehouse_id:
-        workspace.ctr = workspace.ctr.with_env_variable("DATABRICKS_WAREHOUSE_ID", databricks_warehouse_id)
-
-    workspace.ctr = workspace.ctr.with_env_variable("DATABRICKS_APP_PORT", str(port))
-    workspace.ctr = workspace.ctr.with_env_variable("DATABRICKS_APP_NAME", app_dir.name)
-    workspace.ctr = workspace.ctr.with_env_variable("FLASK_RUN_HOST", "0.0.0.0")
+    # Persistent npm download cache. Never shared between parallel evaluations (the npm
+    # cache can be corrupted under parallel execution, see dagger_run): with PRIVATE
+    # sharing, an evaluation that finds the volume in use gets a separate one instead
+    npm_cache = client.cache_volume(f"klaudbiusz-npm-{template}")
+    workspace.ctr = workspace.ctr.with_mounted_cache(
+        "/root/.npm",
+        npm_cache,
+        sharing=dagger.CacheSharingMode.PRIVATE,
+    )
+
+    # Copy all eval scripts (.sh files of the template's eval directory) into container
+    for script_name, content in get_eval_scripts(template).items():
+        workspace = workspace.write_file(f"/eval/{script_name}", content.decode(), force=True)
+
+    # Set environment variables for evaluation; Databricks credentials come from
+    # the host environment and unset ones are skipped
     # Note: Don't set DATABRICKS_CLIENT_ID/SECRET when using PAT auth (DATABRICKS_TOKEN)
     # The Databricks SDK doesn't allow mixing OAuth and PAT auth methods
+    env = {
+        "DATABRICKS_HOST": os.getenv("DATABRICKS_HOST", ""),
+        "DATABRICKS_TOKEN": os.getenv("DATABRICKS_TOKEN", ""),
+        "DATABRICKS_WAREHOUSE_ID": os.getenv("DATABRICKS_WAREHOUSE_ID", ""),
+        "DATABRICKS_APP_PORT": str(port),
+        "DATABRICKS_APP_NAME": app_dir.name,
+        "FLASK_RUN_HOST": "0.0.0.0",
+    }
+    for key, value in env.items():
+        if value:
+            workspace.ctr = workspace.ctr.with_env_variable(key, value)
 
     # Expose port for health checks
     workspace.ctr = workspace.ctr.with_exposed_port(port)
@@ -129,12 +132,11 @@ async def check_runtime(workspace: Workspace) -> ExecResult:
     Returns:
         ExecResult with exit code, stdout, stderr
     """
-    import time
-    # Add cache-busting env var to force Dagger to re-run the command
-    # Without this, Dagger caches the result and returns it instantly
-    workspace.ctr = workspace.ctr.with_env_variable("_EVAL_TIMESTAMP", str(time.time()))
+    # Put a nonce in the exec's own arguments to force Dagger to re-run the command;
+    # without it Dagger caches the result and returns it instantly. Unlike setting an
+    # env var on workspace.ctr, this doesn't invalidate the later type check/test execs
     # Use the start.sh script which handles npm start and health checks
-    result = await workspace.exec(["bash", "/eval/start.sh"])
+    result = await workspace.exec(["env", f"_EVAL_NONCE={time.time_ns()}", "bash", "/eval/start.sh"])
     return result
 
 
@@ -1,20 +1,129 @@
 """TypeScript Workspace Factory for Docker-based Evaluation (no Dagger).
 
 This module provides utilities to create Docker workspaces configured for
-evaluating TypeScript applications, using plain docker CLI instead of Dagger.
+evaluating TypeScript applications, using plain docker CLI instead of Dagger,
+plus a warm container pool for bulk evaluation.
 """
 
+import atexit
+import logging
 import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Self
 
+from cli.utils.coverage import is_coverage_row
 from cli.utils.docker_workspace import DockerWorkspace
 from cli.utils.dagger_utils import ExecResult
+from cli.utils.eval_scripts import get_eval_scripts
+from cli.utils.shared import is_databricks_environment
+
+logger = logging.getLogger(__name__)
+
+
+BASE_IMAGE = "node:20-alpine"
+
+
+def _workspace_env(app_dir: Path, port: int) -> dict[str, str]:
+    """Environment variables passed to the app under evaluation."""
+    return {
+        "DATABRICKS_HOST": os.getenv("DATABRICKS_HOST", ""),
+        "DATABRICKS_TOKEN": os.getenv("DATABRICKS_TOKEN", ""),
+        "DATABRICKS_WAREHOUSE_ID": os.getenv("DATABRICKS_WAREHOUSE_ID", ""),
+        "DATABRICKS_APP_PORT": str(port),
+        "DATABRICKS_APP_NAME": app_dir.name,
+        "FLASK_RUN_HOST": "0.0.0.0",
+    }
+
+
+def docker_daemon_available() -> bool:
+    """Check that the docker CLI is installed and its daemon answers."""
+    if shutil.which("docker") is None:
+        return False
+    try:
+        result = subprocess.run(
+            ["docker", "info", "--format", "{{.ServerVersion}}"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=1)
+def _docker_host_resources() -> tuple[int, int]:
+    """CPU count and total memory (bytes) of the Docker host, or (0, 0) if unknown.
+
+    Asked from the daemon rather than read locally, since e.g. Docker Desktop
+    runs containers in a VM with fewer CPUs than the machine.
+    """
+    try:
+        result = subprocess.run(
+            ["docker", "info", "--format", "{{.NCPU}} {{.MemTotal}}"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        ncpu, mem_total = result.stdout.split()
+        return int(ncpu), int(mem_total)
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        return 0, 0
+
+
+def container_limits(cpu_slot: int | None, slots: int) -> tuple[str | None, int | None]:
+    """CPU set and memory limit for one of `slots` concurrently running containers.
+
+    Each slot gets a disjoint range of the Docker host's CPUs, so parallel
+    builds and test runs don't contend for the same cores. On Databricks the
+    host memory is also split evenly, so one runaway app can't OOM the others.
+
+    Set EVAL_CPU_PINNING=0 to disable pinning. It is also dropped automatically
+    if the daemon rejects the CPU set (NCPU is a count, and cpuset-restricted
+    hosts may not expose CPU ids starting at 0).
+
+    Args:
+        cpu_slot: 0-based slot index, or None to not pin
+        slots: Number of containers running concurrently
+
+    Returns:
+        (cpuset_cpus, memory_bytes), either None if not applicable
+    """
+    if cpu_slot is None:
+        return None, None
+    ncpu, mem_total = _docker_host_resources()
+
+    cpuset_cpus = None
+    if ncpu and os.environ.get("EVAL_CPU_PINNING", "1") != "0":
+        per_slot = max(1, ncpu // slots)
+        start = (cpu_slot % (ncpu // per_slot)) * per_slot
+        cpuset_cpus = str(start) if per_slot == 1 else f"{start}-{start + per_slot - 1}"
+
+    memory_bytes = mem_total // slots if mem_total and is_databricks_environment() else None
+    return cpuset_cpus, memory_bytes
+
+
+def _copy_eval_scripts(workspace: DockerWorkspace, template: str) -> None:
+    """Copy template eval scripts into /eval in the container."""
+    if scripts := get_eval_scripts(template):
+        # One tar stream creates /eval and writes all .sh files, already executable
+        workspace.write_files(scripts, "/eval", mode=0o755)
 
 
 def create_ts_workspace_docker(
     app_dir: Path,
     template: str,
     port: int,
+    cpu_slot: int | None = None,
+    slots: int = 1,
 ) -> DockerWorkspace:
     """Create a Docker workspace for TypeScript app evaluation.
 
@@ -22,43 +131,188 @@ def create_ts_workspace_docker(
         app_dir: Path to the app directory on host
         template: Template type (trpc, dbx-sdk, or docker)
         port: Port to expose for the app (e.g., 8000, 8001, etc.)
+        cpu_slot: Optional 0-based slot to pin the container's CPUs (see container_limits)
+        slots: Number of concurrently running workspaces
 
     Returns:
         DockerWorkspace configured with Node.js, app files, and eval scripts
     """
-    # Prepare environment variables
-    env_vars = {
-        "DATABRICKS_HOST": os.getenv("DATABRICKS_HOST", ""),
-        "DATABRICKS_TOKEN": os.getenv("DATABRICKS_TOKEN", ""),
-        "DATABRICKS_WAREHOUSE_ID": os.getenv("DATABRICKS_WAREHOUSE_ID", ""),
-        "DATABRICKS_APP_PORT": str(port),
-        "DATABRICKS_APP_NAME": app_dir.name,
-        "FLASK_RUN_HOST": "0.0.0.0",
-    }
-
     # Create workspace
+    cpuset_cpus, memory_bytes = container_limits(cpu_slot, slots)
     workspace = DockerWorkspace.create(
         app_dir=app_dir,
-        base_image="node:20-alpine",
+        base_image=BASE_IMAGE,
         port=port,
-        env_vars=env_vars,
+        env_vars=_workspace_env(app_dir, port),
+        cpuset_cpus=cpuset_cpus,
+        memory_bytes=memory_bytes,
     )
 
     # Copy eval scripts into container
-    eval_dir = Path(__file__).parent.parent / "eval" / template
-    if eval_dir.exists():
-        # Create /eval directory in container
-        workspace.exec(["mkdir", "-p", "/eval"])
-
-        # Copy all .sh files from eval directory
-        for script_path in eval_dir.glob("*.sh"):
-            workspace.copy_file(script_path, f"/eval/{script_path.name}")
-            # Make executable
-            workspace.exec(["chmod", "+x", f"/eval/{script_path.name}"])
+    _copy_eval_scripts(workspace, template)
 
     return workspace
 
 
+class DockerWorkspacePool:
+    """Pool of warm Docker workspaces, reused across app evaluations.
+
+    Containers are started once (base image pulled, bash/curl installed) and
+    handed out per evaluation. The app is copied into /app on acquire and
+    wiped on release, so each evaluation still starts from a clean /app.
+
+    Pooled containers are template-agnostic (eval scripts are copied in on
+    acquire), so all templates share a single queue.
+
+    Usage:
+        pool = DockerWorkspacePool(size=4)
+        workspace = pool.acquire(app_dir, "trpc", port=8001)
+        try:
+            ...
+        finally:
+            pool.release(workspace)
+    """
+
+    def __init__(self, size: int = 4):
+        """Pre-spawn `size` containers, in parallel.
+
+        Args:
+            size: Number of warm containers (usually the parallelism)
+        """
+        self._idle: queue.Queue[DockerWorkspace] = queue.Queue()
+        self._members: dict[str, DockerWorkspace] = {}  # all containers owned by the pool, idle or in use
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Safety net for pools that are never closed; close() unregisters it
+        atexit.register(self.close)
+
+        if size > 0:
+            try:
+                with ThreadPoolExecutor(max_workers=size) as executor:
+                    futures = [executor.submit(self._spawn) for _ in range(size)]
+                for future in futures:
+                    try:
+                        self._idle.put(future.result())
+                    except (RuntimeError, subprocess.TimeoutExpired) as e:
+                        logger.warning(f"Failed to pre-spawn workspace: {e}")
+            except BaseException:
+                # Don't orphan the containers that did start
+                self.close()
+                raise
+
+    def _spawn(self) -> DockerWorkspace:
+        """Start a new empty workspace container."""
+        workspace = DockerWorkspace.create(app_dir=None, base_image=BASE_IMAGE)
+        with self._lock:
+            self._members[workspace.container_id] = workspace
+        return workspace
+
+    def acquire(
+        self,
+        app_dir: Path,
+        template: str,
+        port: int,
+        cpu_slot: int | None = None,
+        slots: int = 1,
+    ) -> DockerWorkspace:
+        """Take a warm workspace and load the app and eval scripts into it.
+
+        Spawns a new container if none is idle.
+
+        Args:
+            app_dir: Path to the app directory on host
+            template: Template type (trpc, dbx-sdk, or docker)
+            port: Port the app should listen on
+            cpu_slot: Optional 0-based slot to pin the container's CPUs (see container_limits)
+            slots: Number of concurrently running workspaces
+
+        Returns:
+            DockerWorkspace with the app copied to /app
+        """
+        try:
+            workspace = self._idle.get_nowait()
+        except queue.Empty:
+            workspace = self._spawn()
+
+        workspace.env_vars = _workspace_env(app_dir, port)
+        try:
+            if cpu_slot is not None:
+                workspace.set_limits(*container_limits(cpu_slot, slots))
+            workspace.copy_dir(app_dir.resolve(), "/app")
+            _copy_eval_scripts(workspace, template)
+        except Exception:
+            self._discard(workspace)
+            raise
+        return workspace
+
+    def release(self, workspace: DockerWorkspace) -> None:
+        """Reset a workspace and return it to the pool.
+
+        Stops any app processes and wipes /app and /eval. Containers that
+        fail to reset are removed instead of being reused.
+        """
+        with self._lock:
+            owned = workspace.container_id in self._members
+        if self._closed or not owned:
+            self._discard(workspace)
+            return
+
+        workspace.env_vars = {}
+        reset = workspace.exec(
+            [
+                "sh",
+                "-c",
+                "([ -f /eval/stop.sh ] && bash /eval/stop.sh); "
+                "pkill -9 node; "
+                "find /app -mindepth 1 -maxdepth 1 -exec rm -rf {} + && rm -rf /eval",
+            ],
+            cwd="/",
+            timeout=60,
+        )
+        if reset.exit_code != 0:
+            logger.warning(f"Failed to reset {workspace.container_name}: {reset.stderr}")
+            self._discard(workspace)
+            return
+
+        self._idle.put(workspace)
+
+    def _discard(self, workspace: DockerWorkspace) -> None:
+        with self._lock:
+            self._members.pop(workspace.container_id, None)
+        workspace.cleanup()
+
+    def close(self, remove_in_use: bool = False) -> None:
+        """Remove all idle pooled containers; in-use ones are removed on release.
+
+        Args:
+            remove_in_use: Also remove containers still held by evaluations, so
+                their running commands fail fast instead of running to completion
+                (used when evaluations are interrupted)
+        """
+        self._closed = True
+        atexit.unregister(self.close)
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        if remove_in_use:
+            with self._lock:
+                in_use = list(self._members)
+            if in_use:
+                # Only the containers are removed here; each owner still releases
+                # (and so cleans up) its workspace from its own thread
+                subprocess.run(["docker", "rm", "-f", *in_use], capture_output=True, timeout=60)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 def install_dependencies(workspace: DockerWorkspace) -> ExecResult:
     """Install npm dependencies using install.sh script.
 
@@ -66,9 +320,9 @@ def install_dependencies(workspace: DockerWorkspace) -> ExecResult:
         workspace: Configured Docker workspace
 
     Returns:
-        ExecResult with exit code, stdout, stderr
+        ExecResult with exit code, tail of stdout/stderr
     """
-    result = workspace.exec(["bash", "/eval/install.sh"], timeout=300)
+    result = workspace.exec_stream(["bash", "/eval/install.sh"], timeout=300)
     return result
 
 
@@ -79,9 +333,9 @@ def build_app(workspace: DockerWorkspace) -> ExecResult:
         workspace: Configured Docker workspace
 
     Returns:
-        ExecResult with exit code, stdout, stderr
+        ExecResult with exit code, tail of stdout/stderr
     """
-    result = workspace.exec(["bash", "/eval/build.sh"], timeout=300)
+    result = workspace.exec_stream(["bash", "/eval/build.sh"], timeout=300)
     return result
 
 
@@ -124,9 +378,107 @@ def run_tests(workspace: DockerWorkspace, test_port: int) -> ExecResult:
         test_port: Port to use for test server (to avoid conflicts)
 
     Returns:
-        ExecResult with exit code, stdout, stderr
+        ExecResult with exit code, tail of stdout (after any coverage summary rows) and stderr
     """
-    # Set test port environment variable
-    workspace.exec(["sh", "-c", f"export TEST_PORT={test_port}"])
-    result = workspace.exec(["bash", "/eval/test.sh"], timeout=180)
+    # Only the output tail is kept, so hold on to coverage summary rows
+    # (printed before the per-file table) for coverage parsing
+    coverage_rows: list[str] = []
+
+    def keep_coverage_row(line: str) -> None:
+        if is_coverage_row(line):
+            coverage_rows.append(line)
+
+    result = workspace.exec_stream(
+        ["bash", "/eval/test.sh"],
+        timeout=180,
+        on_line=keep_coverage_row,
+        env={"TEST_PORT": str(test_port)},
+    )
+    if coverage_rows:
+        result.stdout = "\n".join([*coverage_rows, result.stdout])
     return result
+
+
+CI_STEPS = ("install", "build", "typecheck", "test")
+_STEP_MARKER = "::STEP::"
+
+
+class _StepSplitter:
+    """Split fused pipeline output on ::STEP:: markers into per-step results."""
+
+    def __init__(self, tail_lines: int = 200):
+        self.steps: dict[str, tuple[ExecResult, float]] = {}
+        self._tail_lines = tail_lines
+        self._name: str | None = None
+        self._start = 0.0
+        self._lines: deque[str] = deque(maxlen=tail_lines)
+        self._coverage_rows: list[str] = []
+
+    def on_line(self, line: str) -> None:
+        if line.startswith(_STEP_MARKER):
+            event, _, code = line[len(_STEP_MARKER) :].partition("::")
+            name, _, phase = event.rpartition("_")
+            if phase == "start":
+                self._name, self._start = name, time.monotonic()
+                self._lines = deque(maxlen=self._tail_lines)
+                self._coverage_rows = []
+                return
+            if phase == "end" and name == self._name:
+                self._finish_step(int(code) if code.isdigit() else 1)
+                return
+        if self._name is not None:
+            self._lines.append(line)
+            # Kept outside the tail so test coverage can still be parsed
+            if is_coverage_row(line):
+                self._coverage_rows.append(line)
+
+    def finish(self, result: ExecResult) -> dict[str, tuple[ExecResult, float]]:
+        """Close a step cut short (e.g. timeout) and fill in steps that never ran."""
+        if self._name is not None:
+            self._finish_step(result.exit_code or 1)
+        for name in CI_STEPS:
+            if name not in self.steps:
+                self.steps[name] = (ExecResult(exit_code=result.exit_code or 1, stdout="", stderr=result.stderr), 0.0)
+        return self.steps
+
+    def _finish_step(self, exit_code: int) -> None:
+        output = "\n".join([*self._coverage_rows, *self._lines])
+        self.steps[self._name] = (
+            ExecResult(exit_code=exit_code, stdout=output, stderr=output),
+            time.monotonic() - self._start,
+        )
+        self._name = None
+
+
+def run_ci_pipeline(workspace: DockerWorkspace, test_port: int) -> dict[str, tuple[ExecResult, float]]:
+    """Run install, build, typecheck and tests in a single container exec.
+
+    Saves an exec round trip per step compared to calling install_dependencies,
+    build_app, check_types and run_tests in turn. Each step's output is wrapped
+    in ::STEP::<name>_start / ::STEP::<name>_end::<exit code> markers, which are
+    used to recover per-step exit codes, durations and output. As in the
+    per-step flow, typecheck and tests only run if dependencies installed.
+
+    Args:
+        workspace: Configured Docker workspace
+        test_port: Port to use for test server (to avoid conflicts)
+
+    Returns:
+        Dict of step name (see CI_STEPS) -> (ExecResult, duration in seconds).
+        Each step's stdout and stderr hold the tail of its combined output; a
+        step that never ran is reported as failed with the exec's stderr.
+    """
+    script = (
+        'step() { name=$1; shift; echo "::STEP::${name}_start"; "$@" 2>&1; code=$?; '
+        'echo "::STEP::${name}_end::$code"; return $code; }\n'
+        "step install bash /eval/install.sh; installed=$?\n"
+        "step build bash /eval/build.sh\n"
+        'if [ "$installed" -eq 0 ]; then\n'
+        "  step typecheck bash /eval/typecheck.sh\n"
+        f"  TEST_PORT={test_port} step test bash /eval/test.sh\n"
+        "fi\n"
+    )
+    splitter = _StepSplitter()
+    # Same overall budget as the separate steps (300 + 300 + 120 + 180)
+    result = workspace.exec_stream(["bash", "-c", script], timeout=900, on_line=splitter.on_line, tail_lines=20)
+    return splitter.finish(result)